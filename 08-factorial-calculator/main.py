@@ -16,10 +16,52 @@ Calculate factorials using recursion and iteration methods.
 - Mathematical operations
 - Base cases and edge conditions
 - Big integers in Python
+- Prime factorization and product trees
 """
 
+import csv
+import gc
 import math
+import os
+import statistics
+import sys
 import time
+import zlib
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal, localcontext
+from functools import lru_cache, partial
+from itertools import compress
+
+# NumPy is optional - factorial_prime_exponents() vectorizes with it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# factorial_facts() computes n! exactly up to here, analytically beyond
+FACTS_EXACT_LIMIT = 1000
+
+# factorial_facts() shows the full prime factorization up to here
+FACTS_FACTORIZATION_LIMIT = 10**7
+
+# π to 50 places for Stirling's formula (only ½·ln(2π) needs it)
+PI = Decimal("3.14159265358979323846264338327950288419716939937510")
+
+# Digits per piece in write_decimal() (a multiple of 3, below Python's
+# 4300-digit int-to-str limit)
+DECIMAL_CHUNK_DIGITS = 3000
+
+# Factorials from here up go through the disk cache once it is enabled
+DISK_CACHE_MIN_N = 10000
+DISK_CACHE_MAGIC = b'FACT'
+
+# Below this n, starting worker processes costs more than it saves
+PARALLEL_MIN_N = 20000
+
+# factorial_recursive() needs one stack frame per number
+RECURSION_SAFE_LIMIT = sys.getrecursionlimit() - 100
 
 def factorial_recursive(n):
     """
@@ -35,6 +77,31 @@ def factorial_recursive(n):
     # Recursive case
     return n * factorial_recursive(n - 1)
 
+def _range_product(low, high):
+    """
+    Multiply low × (low+1) × ... × high by splitting the range in half.
+    """
+    if high - low < 8:
+        result = 1
+        for i in range(low, high + 1):
+            result *= i
+        return result
+    
+    mid = (low + high) // 2
+    return _range_product(low, mid) * _range_product(mid + 1, high)
+
+def factorial_recursive_split(n):
+    """
+    Calculate factorial using divide-and-conquer recursion.
+    
+    LEARNING: Recursion depth matters
+    factorial_recursive() goes n levels deep and hits Python's recursion
+    limit around n = 1000. Splitting the range 1..n in half at every
+    call only goes log2(n) levels deep (about 20 for n = 1,000,000),
+    and multiplying the halves keeps the numbers balanced.
+    """
+    return _range_product(2, n)
+
 def factorial_iterative(n):
     """
     Calculate factorial using iteration (loop).
@@ -54,6 +121,557 @@ def factorial_builtin(n):
     """
     return math.factorial(n)
 
+class FactorialCache:
+    """
+    🗄️ Incremental, memoized factorial store
+    
+    LEARNING: Memoization - remember results instead of recomputing them
+    - i! is built from the closest known smaller factorial, so asking
+      for 0!, 1!, 2!, ... in order costs one multiplication per step
+    - A jump far past anything known uses a product tree instead of
+      thousands of one-at-a-time multiplications
+    - Every k-th factorial is kept as a checkpoint to restart from, up to
+      a memory budget (least recently used checkpoints are dropped first)
+    - Recently used values live in a small LRU (least recently used)
+      cache, which drops the oldest entry when it is full
+    """
+    
+    def __init__(self, checkpoint_every=1000, max_recent=64, max_checkpoint_bytes=16 * 2**20):
+        self.checkpoint_every = checkpoint_every
+        self.max_recent = max_recent
+        self.max_checkpoint_bytes = max_checkpoint_bytes
+        self.disk = None  # optional FactorialDiskCache for large n
+        self._checkpoints = OrderedDict()  # 0! = 1 is implicit
+        self._checkpoint_bytes = 0
+        self._recent = OrderedDict()
+        self._last = (0, 1)
+    
+    def get(self, n):
+        """
+        Return n!, reusing cached values whenever possible.
+        """
+        if n in self._recent:
+            self._recent.move_to_end(n)
+            return self._recent[n]
+        
+        if self.disk is not None and n >= DISK_CACHE_MIN_N:
+            value = self.disk.get(n)
+            self._remember(n, value)
+            return value
+        
+        start, value = self._closest_below(n)
+        if n - start > self.checkpoint_every:
+            # Too far to step: multiply the gap as a balanced product tree
+            if start < n // 2:
+                value = factorial_prime_split(n)
+            else:
+                value *= _range_product(start + 1, n)
+        else:
+            for i in range(start + 1, n + 1):
+                value *= i
+                if i % self.checkpoint_every == 0:
+                    self._add_checkpoint(i, value)
+        
+        self._last = (n, value)
+        self._remember(n, value)
+        return value
+    
+    def _closest_below(self, n):
+        """
+        Find the largest known (i, i!) with i <= n.
+        """
+        checkpoint = max((i for i in self._checkpoints if i <= n), default=0)
+        if checkpoint:
+            self._checkpoints.move_to_end(checkpoint)
+            best = (checkpoint, self._checkpoints[checkpoint])
+        else:
+            best = (0, 1)
+        
+        for i, value in [self._last, *self._recent.items()]:
+            if best[0] < i <= n:
+                best = (i, value)
+        return best
+    
+    def _add_checkpoint(self, i, value):
+        """
+        Keep i! as a checkpoint, dropping old ones to stay within budget.
+        """
+        size = (value.bit_length() + 7) // 8
+        if size > self.max_checkpoint_bytes:
+            return
+        
+        self._checkpoints[i] = value
+        self._checkpoint_bytes += size
+        while self._checkpoint_bytes > self.max_checkpoint_bytes:
+            _, old = self._checkpoints.popitem(last=False)
+            self._checkpoint_bytes -= (old.bit_length() + 7) // 8
+    
+    def _remember(self, n, value):
+        """
+        Store n! in the LRU cache, evicting the least recently used entry.
+        """
+        self._recent[n] = value
+        if len(self._recent) > self.max_recent:
+            self._recent.popitem(last=False)
+    
+    def clear(self):
+        """
+        Forget everything except 0! = 1.
+        """
+        self._checkpoints.clear()
+        self._checkpoint_bytes = 0
+        self._recent.clear()
+        self._last = (0, 1)
+
+class FactorialDiskCache:
+    """
+    💾 Persistent factorial cache on disk
+    
+    LEARNING: Caching across program runs
+    - Each n! is saved to its own file as raw bytes (int.to_bytes),
+      optionally zlib-compressed
+    - n! = odd part × 2^e, and e is known from Legendre's formula, so
+      only the odd part is stored (about n bits smaller)
+    - A missing n! is derived from the nearest cached one by
+      multiplying (or dividing) by the numbers in between
+    - When the cache grows past max_bytes, the least recently used
+      files are deleted (eviction)
+    """
+    
+    def __init__(self, directory="factorial_cache", max_bytes=256 * 2**20, compress=True):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.compress = compress
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, n):
+        return os.path.join(self.directory, f"{n}.fact")
+    
+    def cached_values(self):
+        """
+        Return the sorted list of n whose factorial is on disk.
+        """
+        return sorted(int(name[:-5]) for name in os.listdir(self.directory)
+                      if name.endswith(".fact") and name[:-5].isdigit())
+    
+    def get(self, n):
+        """
+        Return n!, from disk when cached, derived from the nearest cached
+        value otherwise (and then saved).
+        """
+        cached = self.cached_values()
+        if n in cached:
+            return self._load(n)
+        
+        nearest = min(cached, key=lambda m: abs(m - n), default=None)
+        if nearest is None or abs(nearest - n) > n // 2:
+            value = factorial_prime_split(n)
+        elif nearest < n:
+            value = self._load(nearest) * _range_product(nearest + 1, n)
+        else:
+            value = self._load(nearest) // _range_product(n + 1, nearest)
+        
+        self.put(n, value)
+        return value
+    
+    def put(self, n, value):
+        """
+        Save n! to disk, then evict old entries if over the size limit.
+        """
+        odd = value >> count_prime_factors(n, 2)
+        payload = odd.to_bytes((odd.bit_length() + 7) // 8, 'little')
+        flags = 0
+        if self.compress:
+            payload = zlib.compress(payload, 1)
+            flags = 1
+        
+        # Write to a temporary file first so a crash never leaves half a file
+        path = self._path(n)
+        with open(path + ".tmp", 'wb') as f:
+            f.write(DISK_CACHE_MAGIC + bytes([flags]) + payload)
+        os.replace(path + ".tmp", path)
+        
+        self._evict(keep=path)
+    
+    def _load(self, n):
+        """
+        Read n! back from its file.
+        """
+        path = self._path(n)
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data[:4] != DISK_CACHE_MAGIC:
+            raise ValueError(f"{path} is not a factorial cache file")
+        
+        payload = zlib.decompress(data[5:]) if data[4] & 1 else data[5:]
+        os.utime(path)  # mark as recently used
+        return int.from_bytes(payload, 'little') << count_prime_factors(n, 2)
+    
+    def _evict(self, keep=None):
+        """
+        Delete least recently used files until the cache fits in max_bytes.
+        """
+        files = []
+        for m in self.cached_values():
+            path = self._path(m)
+            stat = os.stat(path)
+            files.append((stat.st_mtime, stat.st_size, path))
+        
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            if path != keep:
+                os.remove(path)
+                total -= size
+    
+    def clear(self):
+        """
+        Delete every cached file.
+        """
+        for m in self.cached_values():
+            os.remove(self._path(m))
+
+# Shared by the table, the facts and the method comparison
+_factorial_cache = FactorialCache()
+
+def enable_disk_cache(directory="factorial_cache", max_bytes=256 * 2**20, compress=True):
+    """
+    Back the shared factorial cache with a FactorialDiskCache.
+    """
+    _factorial_cache.disk = FactorialDiskCache(directory, max_bytes, compress)
+    return _factorial_cache.disk
+
+def factorial_cached(n):
+    """
+    Calculate factorial through the shared FactorialCache.
+    """
+    return _factorial_cache.get(n)
+
+def factorial_prime_exponents(n):
+    """
+    Prime factorization of n!: two parallel arrays (primes, exponents).
+    
+    LEARNING: Legendre's formula for every prime at once
+    - One sieve finds all primes up to n
+    - For p > sqrt(n) only the first term n // p is non-zero, so most
+      exponents come from a single division
+    - With NumPy, each Legendre step divides the whole array at once
+    Compact arrays (8 bytes per entry) keep n = 10^8 (5.7 million primes)
+    in memory easily. Without NumPy, array('q') is returned.
+    """
+    if n < 2:
+        empty = np.zeros(0, dtype=np.int64) if np is not None else array('q')
+        return empty, empty[:]
+    
+    root = math.isqrt(n)
+    
+    if np is not None:
+        sieve = np.ones(n + 1, dtype=bool)
+        sieve[:2] = False
+        for p in range(2, root + 1):
+            if sieve[p]:
+                sieve[p * p::p] = False
+        primes = np.flatnonzero(sieve).astype(np.int64)
+        
+        exponents = n // primes
+        small = primes[:np.searchsorted(primes, root, side='right')]
+        q = exponents[:len(small)].copy()
+        while q.any():
+            q //= small
+            exponents[:len(small)] += q
+        return primes, exponents
+    
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, root + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    primes = array('q', compress(range(n + 1), sieve))
+    del sieve
+    
+    exponents = array('q', (n // p for p in primes))
+    for i, p in enumerate(primes):
+        if p > root:
+            break
+        exponents[i] = count_prime_factors(n, p)
+    return primes, exponents
+
+def _product(values, low=0, high=None):
+    """
+    Multiply values[low:high] by binary splitting.
+    
+    LEARNING: Product trees - multiplying numbers of similar size is much
+    cheaper than growing one huge number by a small one each step, so
+    split the list in half, multiply each half, then combine.
+    """
+    if high is None:
+        high = len(values)
+    
+    if high - low <= 8:
+        result = 1
+        for i in range(low, high):
+            result *= values[i]
+        return result
+    
+    mid = (low + high) // 2
+    return _product(values, low, mid) * _product(values, mid, high)
+
+def factorial_prime_split(n):
+    """
+    Calculate factorial from its prime factorization.
+    
+    LEARNING: Legendre's formula gives the exponent of every prime p in n!
+    (see count_prime_factors). Primes are grouped by the bits of their
+    exponents, so n! = P_k^(2^k) × ... × P_1^2 × P_0 is built with a few
+    squarings and balanced product trees instead of n small multiplications.
+    """
+    primes, exponents = factorial_prime_exponents(n)
+    if len(primes) == 0:
+        return 1
+    
+    # Plain Python ints - NumPy int64 would overflow in the products
+    primes = primes.tolist()
+    exponents = exponents.tolist()
+    
+    # The exponent of 2 is the largest, so it sets the number of bits
+    result = 1
+    for bit in range(exponents[0].bit_length() - 1, -1, -1):
+        result *= result
+        group = [p for p, e in zip(primes, exponents) if e >> bit & 1]
+        result *= _product(group)
+    
+    return result
+
+# Miller-Rabin with these bases is exact for every m < 3.3 × 10^24
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+@lru_cache(maxsize=256)
+def _is_prime(m):
+    """
+    Miller-Rabin primality check for moduli.
+    
+    LEARNING: Trial division needs √m steps - about 10^9 for m near 10^18.
+    Miller-Rabin needs a handful of modular powers per base instead.
+    """
+    if m < 2:
+        return False
+    for p in _MILLER_RABIN_BASES:
+        if m % p == 0:
+            return m == p
+    
+    # Write m - 1 = d × 2^s with d odd
+    d, s = m - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, m)
+        if x == 1 or x == m - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % m
+            if x == m - 1:
+                break
+        else:
+            return False  # a proves m composite
+    return True
+
+def _range_product_mod(low, high, m):
+    """
+    low × (low+1) × ... × high modulo m.
+    """
+    result = 1 % m
+    for i in range(low, high + 1):
+        result = result * i % m
+    return result
+
+def factorial_mod(n, m):
+    """
+    Calculate n! mod m without computing n!
+    
+    LEARNING: Modular arithmetic keeps every number smaller than m
+    - If n >= m, then m itself is one of the factors, so n! ≡ 0 (mod m)
+    - Wilson's theorem: (p-1)! ≡ -1 (mod p) for a prime p, so for n close
+      to p it's faster to divide -1 by (n+1)(n+2)...(p-1)
+    """
+    if n >= m:
+        return 0
+    
+    if n > m // 2 and _is_prime(m):
+        rest = _range_product_mod(n + 1, m - 1, m)
+        return -pow(rest, -1, m) % m
+    
+    return _range_product_mod(2, n, m)
+
+def _binomial_mod_prime(n, k, p):
+    """
+    C(n, k) mod prime p, via Lucas' theorem for n >= p.
+    """
+    result = 1
+    while n or k:
+        ni, ki = n % p, k % p
+        if ki > ni:
+            return 0
+        ki = min(ki, ni - ki)
+        numerator = _range_product_mod(ni - ki + 1, ni, p)
+        denominator = _range_product_mod(2, ki, p)
+        result = result * numerator * pow(denominator, -1, p) % p
+        n //= p
+        k //= p
+    return result
+
+def binomial(n, k, m=None):
+    """
+    Calculate the binomial coefficient C(n, k) = n! / (k! × (n-k)!),
+    optionally modulo m.
+    
+    LEARNING: Lucas' theorem - for a prime p, C(n, k) mod p is the product
+    of C(n_i, k_i) over the base-p digits of n and k. Every digit is below
+    p, so each piece stays small.
+    """
+    if k < 0 or k > n:
+        return 0
+    if m is None:
+        return math.comb(n, k)
+    if _is_prime(m):
+        return _binomial_mod_prime(n, k, m)
+    return math.comb(n, k) % m
+
+class BinomialTable:
+    """
+    📋 Precomputed factorials and inverse factorials modulo a prime
+    
+    LEARNING: Precomputation for batched queries
+    After one O(limit) setup, every C(n, k) mod p is just
+    fact[n] × inv_fact[k] × inv_fact[n-k] - three lookups and two
+    multiplications. The inverse factorials are built backwards from a
+    single modular inverse: 1/(i-1)! = i × 1/i!
+    """
+    
+    def __init__(self, limit, p):
+        if not _is_prime(p):
+            raise ValueError(f"{p} is not prime")
+        
+        self.p = p
+        size = min(limit, p - 1) + 1
+        
+        fact = [1] * size
+        for i in range(1, size):
+            fact[i] = fact[i - 1] * i % p
+        
+        inv_fact = [1] * size
+        inv_fact[-1] = pow(fact[-1], -1, p)
+        for i in range(size - 1, 0, -1):
+            inv_fact[i - 1] = inv_fact[i] * i % p
+        
+        self.fact = fact
+        self.inv_fact = inv_fact
+    
+    def factorial(self, n):
+        """
+        n! mod p (0 once n reaches p).
+        """
+        if n >= self.p:
+            return 0
+        return self.fact[n]
+    
+    def comb(self, n, k):
+        """
+        C(n, k) mod p, using Lucas' theorem when n >= p.
+        """
+        if k < 0 or k > n:
+            return 0
+        
+        fact, inv_fact, p = self.fact, self.inv_fact, self.p
+        if n < len(fact):
+            return fact[n] * inv_fact[k] * inv_fact[n - k] % p
+        if n < p:
+            raise ValueError(f"n = {n} is beyond the table limit {len(fact) - 1}")
+        
+        result = 1
+        while n or k:
+            ni, ki = n % p, k % p
+            if ki > ni:
+                return 0
+            if ni >= len(fact):
+                raise ValueError(f"Lucas digit {ni} is beyond the table limit {len(fact) - 1}")
+            result = result * fact[ni] * inv_fact[ki] * inv_fact[ni - ki] % p
+            n //= p
+            k //= p
+        return result
+    
+    def comb_many(self, queries):
+        """
+        Answer a batch of (n, k) queries, returning a list of C(n, k) mod p.
+        """
+        fact, inv_fact, p = self.fact, self.inv_fact, self.p
+        size = len(fact)
+        return [fact[n] * inv_fact[k] * inv_fact[n - k] % p
+                if 0 <= k <= n < size else self.comb(n, k)
+                for n, k in queries]
+
+def _chunk_product(bounds):
+    """
+    Worker task: multiply one chunk low..high of the factorial range.
+    """
+    low, high = bounds
+    return _range_product(low, high)
+
+def _balanced_chunks(n, count):
+    """
+    Split 2..n into count ranges whose products have about the same size.
+    
+    LEARNING: Load balancing - numbers near n have more digits than
+    numbers near 2, so equal-length ranges would give the last worker the
+    most work. The digits of low..high add up to about
+    F(high) - F(low) with F(x) = x·ln(x) - x, so the cut points are
+    chosen where F grows by equal steps.
+    """
+    def F(x):
+        return x * math.log(x) - x
+    
+    step = (F(n) - F(2)) / count
+    bounds = []
+    low = 2
+    for i in range(1, count):
+        # Binary search for the x where F(x) reaches the i-th target
+        target = F(2) + i * step
+        lo, hi = low, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if F(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo > low:
+            bounds.append((low, lo - 1))
+            low = lo
+    bounds.append((low, n))
+    return bounds
+
+def factorial_parallel(n, workers=None, chunks_per_worker=4):
+    """
+    Calculate factorial on several CPU cores.
+    
+    LEARNING: Parallel processing with a process pool
+    - 2..n is cut into balanced chunks (a few per worker, so a slow
+      chunk doesn't leave other cores idle)
+    - Each worker multiplies its chunk with the divide-and-conquer product
+    - The partial products are combined in a balanced product tree
+    """
+    if n < PARALLEL_MIN_N:
+        return _range_product(2, n)
+    
+    workers = workers or os.cpu_count() or 1
+    bounds = _balanced_chunks(n, workers * chunks_per_worker)
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partials = list(pool.map(_chunk_product, bounds))
+    
+    return _product(partials)
+
 def get_valid_number():
     """
     Get and validate user input.
@@ -70,6 +688,60 @@ def get_valid_number():
         except ValueError:
             print("❌ Invalid input! Please enter a valid integer.")
 
+def _decimal_pieces(value, level, powers, pad):
+    """
+    Yield the decimal digits of value as strings, most significant first.
+    
+    powers[level] splits value into a high and a low half; padded pieces
+    are zero-filled to their full width.
+    """
+    if level < 0:
+        text = str(value)
+        yield text.zfill(DECIMAL_CHUNK_DIGITS) if pad else text
+        return
+    
+    high, low = divmod(value, powers[level])
+    if high or pad:
+        yield from _decimal_pieces(high, level - 1, powers, pad)
+        yield from _decimal_pieces(low, level - 1, powers, True)
+    else:
+        yield from _decimal_pieces(low, level - 1, powers, False)
+
+def _group_thousands(piece, first):
+    """
+    Insert commas every three digits (pieces after the first are full width).
+    """
+    head = len(piece) % 3 if first else 0
+    groups = [piece[:head]] if head else []
+    groups += [piece[i:i + 3] for i in range(head, len(piece), 3)]
+    return ("" if first else ",") + ",".join(groups)
+
+def write_decimal(value, stream=None, separator=False):
+    """
+    Write a non-negative integer in decimal, one piece at a time.
+    
+    LEARNING: Divide-and-conquer radix conversion
+    str() builds the whole string at once and refuses ints longer than
+    4300 digits. Instead, divide by 10^(c·2^k) to split the number into
+    a high and a low half, recurse, and convert only small pieces with
+    str(). Pieces are written as soon as they are ready, so output
+    starts immediately.
+    """
+    stream = stream or sys.stdout
+    
+    powers = [10 ** DECIMAL_CHUNK_DIGITS]
+    while powers[-1] <= value:
+        powers.append(powers[-1] * powers[-1])
+    
+    digits = 0
+    first = True
+    for piece in _decimal_pieces(value, len(powers) - 2, powers, False):
+        digits += len(piece)
+        stream.write(_group_thousands(piece, first) if separator else piece)
+        first = False
+    
+    return digits
+
 def display_factorial_table(n):
     """
     Display factorial values from 0! to n!
@@ -82,13 +754,95 @@ def display_factorial_table(n):
     print(f"{'n':>5} | {'n!':>30}")
     print("-"*50)
     
+    # Ascending order lets the cache build each i! from (i-1)!
     for i in range(n + 1):
-        fact = factorial_iterative(i)
-        print(f"{i:>5} | {fact:>30,}")
+        fact = factorial_cached(i)
+        if fact < 10**27:
+            print(f"{i:>5} | {fact:>30,}")
+        else:
+            # Stream it instead of building one huge string
+            digits = digit_count(fact)
+            width = digits + (digits - 1) // 3
+            print(f"{i:>5} | " + " " * max(30 - width, 0), end="")
+            write_decimal(fact, separator=True)
+            print()
     
     print("="*50)
 
-def compare_methods(n):
+# Methods timed by compare_methods() and benchmark_sweep()
+FACTORIAL_METHODS = {
+    'Recursive': factorial_recursive,
+    'Recursive (split)': factorial_recursive_split,
+    'Iterative': factorial_iterative,
+    'Built-in': factorial_builtin,
+    'Prime-split': factorial_prime_split,
+    'Parallel': factorial_parallel,
+}
+
+# Each timing sample runs the method enough times to last at least this long
+MIN_SAMPLE_NS = 1_000_000
+
+def benchmark_method(func, n, repeat=7, warmup=2):
+    """
+    Time func(n) reliably and return median, IQR and best time per call.
+    
+    LEARNING: Micro-benchmarking
+    - time.perf_counter_ns() is a high-resolution clock (time.time() is not)
+    - Warm-up runs fill caches before anything is measured
+    - Fast calls are looped so each sample is long enough to measure
+    - The garbage collector is paused so it can't fire mid-sample
+    - The median and interquartile range (IQR) ignore outliers
+    """
+    for _ in range(warmup):
+        func(n)
+    
+    # Find a loop count that makes one sample last at least MIN_SAMPLE_NS
+    loops = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            func(n)
+        if time.perf_counter_ns() - start >= MIN_SAMPLE_NS:
+            break
+        loops *= 2
+    
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for _ in range(loops):
+                func(n)
+            samples.append((time.perf_counter_ns() - start) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    
+    if len(samples) > 1:
+        q1, _, q3 = statistics.quantiles(samples, n=4)
+    else:
+        q1 = q3 = samples[0]
+    
+    return {
+        'median_ns': statistics.median(samples),
+        'iqr_ns': q3 - q1,
+        'min_ns': min(samples),
+        'loops': loops,
+        'runs': repeat,
+    }
+
+def _format_ns(ns):
+    """
+    Format a duration in nanoseconds with a readable unit.
+    """
+    for unit, scale in (('s', 1e9), ('ms', 1e6), ('µs', 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.3f} {unit}"
+    return f"{ns:.0f} ns"
+
+def compare_methods(n, repeat=7, workers=None):
     """
     Compare execution time of different methods.
     
@@ -98,37 +852,101 @@ def compare_methods(n):
     print("⏱️  PERFORMANCE COMPARISON")
     print("="*60)
     
-    # Recursive method
-    start = time.time()
-    result_recursive = factorial_recursive(n)
-    time_recursive = time.time() - start
+    methods = dict(FACTORIAL_METHODS)
+    if workers:
+        methods['Parallel'] = partial(factorial_parallel, workers=workers)
     
-    # Iterative method
-    start = time.time()
-    result_iterative = factorial_iterative(n)
-    time_iterative = time.time() - start
+    result = factorial_cached(n)
+    timings = {}
+    agree = True
     
-    # Built-in method
-    start = time.time()
-    result_builtin = factorial_builtin(n)
-    time_builtin = time.time() - start
+    for name, func in methods.items():
+        # Plain recursion is only safe while n stays below the recursion limit
+        if func is factorial_recursive and n > RECURSION_SAFE_LIMIT:
+            timings[name] = None
+            continue
+        agree = agree and func(n) == result
+        timings[name] = benchmark_method(func, n, repeat)
     
     print(f"Number: {n}")
-    print(f"Result: {result_recursive:,}")
+    if n <= 1000:
+        print(f"Result: {result:,}")
+    else:
+        print(f"Result: {digit_count(result):,} digits")
+    print(f"All methods agree: {'✅ Yes' if agree else '❌ No'}")
     print("-"*60)
-    print(f"Recursive method: {time_recursive:.6f} seconds")
-    print(f"Iterative method: {time_iterative:.6f} seconds")
-    print(f"Built-in method:  {time_builtin:.6f} seconds")
+    print(f"{'Method':<20} {'Median':>12} {'IQR':>12} {'Best':>12}")
+    for name, stats in timings.items():
+        if stats is None:
+            print(f"{name:<20} skipped (n > {RECURSION_SAFE_LIMIT}, stack limit)")
+            continue
+        print(f"{name:<20} {_format_ns(stats['median_ns']):>12} "
+              f"{_format_ns(stats['iqr_ns']):>12} {_format_ns(stats['min_ns']):>12}")
     print("="*60)
     
-    # Determine fastest
-    times = {
-        'Recursive': time_recursive,
-        'Iterative': time_iterative,
-        'Built-in': time_builtin
-    }
-    fastest = min(times, key=times.get)
-    print(f"\n🏆 Fastest method: {fastest}")
+    # Determine fastest by median time
+    measured = {name: stats for name, stats in timings.items() if stats is not None}
+    fastest = min(measured, key=lambda name: measured[name]['median_ns'])
+    print(f"\n🏆 Fastest method: {fastest} (median of {repeat} runs)")
+    
+    # Same product tree on one core vs. several
+    if n >= PARALLEL_MIN_N:
+        speedup = measured['Recursive (split)']['median_ns'] / measured['Parallel']['median_ns']
+        print(f"⚡ Parallel speedup over one core: {speedup:.2f}× "
+              f"({workers or os.cpu_count() or 1} workers)")
+    else:
+        print(f"(Parallel runs on one core below n = {PARALLEL_MIN_N:,})")
+
+def benchmark_sweep(sizes, methods=('Recursive', 'Iterative', 'Built-in'),
+                    repeat=5, csv_path=None):
+    """
+    Time each method over a range of n and show how the cost scales.
+    
+    LEARNING: Scaling analysis - doubling n and watching the time tells
+    you more than a single measurement (linear, quadratic, ...).
+    Results can be saved as CSV for spreadsheets or plotting.
+    """
+    # Open the CSV first so a bad path is reported before a long run
+    csv_file = None
+    if csv_path:
+        try:
+            csv_file = open(csv_path, 'w', newline='')
+        except OSError as e:
+            print(f"❌ Cannot write {csv_path}: {e} - results will not be saved")
+    
+    rows = []
+    print("\n" + "="*60)
+    print("📈 SCALING BENCHMARK (median time per call)")
+    print("="*60)
+    print(f"{'n':>8} | " + " | ".join(f"{name:>12}" for name in methods))
+    print("-"*60)
+    
+    for n in sizes:
+        cells = []
+        for name in methods:
+            func = FACTORIAL_METHODS[name]
+            if func is factorial_recursive and n > RECURSION_SAFE_LIMIT:
+                cells.append(f"{'-':>12}")
+                continue
+            stats = benchmark_method(func, n, repeat)
+            rows.append({'n': n, 'method': name, **stats})
+            cells.append(f"{_format_ns(stats['median_ns']):>12}")
+        print(f"{n:>8} | " + " | ".join(cells))
+    
+    print("="*60)
+    
+    if csv_file is not None:
+        try:
+            with csv_file:
+                writer = csv.DictWriter(csv_file, fieldnames=['n', 'method', 'median_ns', 'iqr_ns',
+                                                              'min_ns', 'loops', 'runs'])
+                writer.writeheader()
+                writer.writerows(rows)
+            print(f"💾 Saved {len(rows)} rows to {csv_path}")
+        except OSError as e:
+            print(f"❌ Could not save {csv_path}: {e}")
+    
+    return rows
 
 def factorial_facts(n):
     """
@@ -136,14 +954,21 @@ def factorial_facts(n):
     
     LEARNING: Mathematical properties and string formatting
     """
-    fact = factorial_iterative(n)
-    
     print("\n" + "="*60)
     print(f"📌 FACTS ABOUT {n}!")
     print("="*60)
-    print(f"Value: {fact:,}")
-    print(f"Number of digits: {len(str(fact))}")
-    print(f"Trailing zeros: {count_trailing_zeros(n)}")
+    
+    if n <= FACTS_EXACT_LIMIT:
+        print("Value: ", end="")
+        write_decimal(factorial_cached(n), separator=True)
+        print()
+    else:
+        # Too big to print - describe it without computing n!
+        print(f"Leading digits: {factorial_leading_digits(n)}...")
+        print(f"Last non-zero digits: ...{factorial_last_nonzero_digits(n):05d}")
+    
+    print(f"Number of digits: {factorial_digit_count(n):,}")
+    print(f"Trailing zeros: {count_trailing_zeros(n):,}")
     
     # Calculate how many times certain primes divide the factorial
     if n >= 2:
@@ -153,8 +978,132 @@ def factorial_facts(n):
     if n >= 5:
         print(f"Times divisible by 5: {count_prime_factors(n, 5)}")
     
+    # Full prime factorization (needs a sieve up to n)
+    if 2 <= n <= FACTS_FACTORIZATION_LIMIT:
+        primes, exponents = factorial_prime_exponents(n)
+        terms = [f"{p}^{e}" if e > 1 else f"{p}" for p, e in zip(primes[:8].tolist(), exponents[:8].tolist())]
+        more = " × ..." if len(primes) > 8 else ""
+        print(f"Distinct prime factors: {len(primes):,}")
+        print(f"Prime factorization: {' × '.join(terms)}{more}")
+    
     print("="*60)
 
+def digit_count(value):
+    """
+    Count the decimal digits of a non-negative integer without str().
+    
+    LEARNING: str() of a huge int is slow and capped by Python's
+    int-to-str digit limit; bit_length() × log10(2) is off by at most one.
+    """
+    if value == 0:
+        return 1
+    digits = int(value.bit_length() * math.log10(2))
+    return digits + 1 if value >= 10 ** digits else digits
+
+def _factorial_log10(n, precision):
+    """
+    log10(n!) from Stirling's series, to the given number of significant digits.
+    
+    LEARNING: Stirling's approximation with correction terms
+    ln n! = n·ln n - n + ½·ln(2πn) + 1/(12n) - 1/(360n³) + 1/(1260n⁵) - 1/(1680n⁷)
+    For n > 1000 the error is below 10^-30.
+    """
+    with localcontext() as ctx:
+        ctx.prec = precision
+        N = Decimal(n)
+        ln_fact = (N * N.ln() - N + (2 * PI * N).ln() / 2
+                   + 1 / (12 * N) - 1 / (360 * N**3)
+                   + 1 / (1260 * N**5) - 1 / (1680 * N**7))
+        return ln_fact / Decimal(10).ln()
+
+def _factorial_log10_split(n):
+    """
+    Return (integer part, fractional part) of log10(n!) for n > FACTS_EXACT_LIMIT.
+    
+    LEARNING: Error correction - if the fractional part lands too close to
+    an integer to be sure which side it is on, retry with more precision.
+    """
+    precision = 2 * len(str(n)) + 40
+    while True:
+        log10 = _factorial_log10(n, precision)
+        whole = int(log10)
+        fraction = log10 - whole
+        if Decimal(10) ** -25 < fraction < 1 - Decimal(10) ** -25:
+            return whole, fraction
+        precision += 20
+
+def factorial_digit_count(n):
+    """
+    Number of digits of n! without computing n!
+    
+    LEARNING: A number x has floor(log10(x)) + 1 digits
+    """
+    if n <= FACTS_EXACT_LIMIT:
+        return digit_count(factorial_cached(n))
+    whole, _ = _factorial_log10_split(n)
+    return whole + 1
+
+def factorial_leading_digits(n, count=10):
+    """
+    First count digits of n! without computing n!
+    
+    LEARNING: The fractional part f of log10(n!) fixes the digits:
+    n! = 10^f × 10^(whole part), and 10^f is between 1 and 10.
+    """
+    if n <= FACTS_EXACT_LIMIT:
+        fact = factorial_cached(n)
+        return fact // 10 ** max(digit_count(fact) - count, 0)
+    
+    _, fraction = _factorial_log10_split(n)
+    with localcontext() as ctx:
+        ctx.prec = count + 20
+        return int(Decimal(10) ** (fraction + count - 1))
+
+@lru_cache(maxsize=None)
+def _unit_prefix_products(modulus):
+    """
+    table[r] = product of 1..r skipping multiples of 5, modulo 5^k.
+    """
+    table = [1] * modulus
+    for r in range(1, modulus):
+        table[r] = table[r - 1] * (r if r % 5 else 1) % modulus
+    return tuple(table)
+
+def factorial_last_nonzero_digits(n, count=5):
+    """
+    Last count digits of n! before its trailing zeros, without computing n!
+    
+    LEARNING: Modular arithmetic and the Chinese Remainder Theorem
+    - Dropping the trailing zeros means dividing by 10^z = 2^z × 5^z
+    - Modulo 2^count the answer is 0 (n! has far more 2s than 5s)
+    - Modulo 5^count, numbers without a factor 5 repeat every 5^count
+      and a full period multiplies to -1 (generalized Wilson theorem),
+      so n!/5^z needs only a small table and log5(n) steps
+    - CRT glues the two answers back together modulo 10^count
+    """
+    zeros = count_trailing_zeros(n)
+    if count_prime_factors(n, 2) - zeros < count:
+        # Small n: not enough spare 2s for the shortcut, compute directly
+        return factorial_cached(n) // 10 ** zeros % 10 ** count
+    
+    mod5 = 5 ** count
+    mod2 = 2 ** count
+    table = _unit_prefix_products(mod5)
+    
+    # n! / 5^zeros (mod 5^count)
+    value = 1
+    m = n
+    while m:
+        sign = -1 if (m // mod5) % 2 else 1
+        value = value * sign * table[m % mod5] % mod5
+        m //= 5
+    
+    # Divide by 2^zeros to finish dividing by 10^zeros
+    residue = value * pow(2, -zeros, mod5) % mod5
+    
+    # CRT: the answer is 0 mod 2^count and residue mod 5^count
+    return mod2 * (residue * pow(mod2, -1, mod5) % mod5)
+
 def count_trailing_zeros(n):
     """
     Count trailing zeros in n!
@@ -199,9 +1148,12 @@ def main():
         print("2. Show factorial table (0! to n!)")
         print("3. Compare calculation methods")
         print("4. Factorial facts")
-        print("5. Exit")
+        print("5. Scaling benchmark (n-sweep)")
+        print("6. Modular factorial and binomial (n! mod m, C(n, k) mod m)")
+        print("7. Enable disk cache for large factorials")
+        print("8. Exit")
         
-        choice = input("\nEnter choice (1-5): ").strip()
+        choice = input("\nEnter choice (1-8): ").strip()
         
         if choice == '1':
             # Calculate factorial
@@ -210,11 +1162,26 @@ def main():
             if n > 1000:
                 print("\n⚠️ Large number! This may take time...")
             
-            result = factorial_iterative(n)
+            result = factorial_cached(n)
+            digits = digit_count(result)
             
             print("\n" + "="*60)
-            print(f"Result: {n}! = {result:,}")
-            print(f"Number of digits: {len(str(result))}")
+            if digits > 10000:
+                path = input(f"{n}! has {digits:,} digits. Save to file (leave empty to print): ").strip()
+                if path:
+                    try:
+                        with open(path, 'w') as f:
+                            write_decimal(result, f)
+                        print(f"💾 Saved {n}! to {path}")
+                    except OSError as e:
+                        print(f"❌ Could not save to {path}: {e}")
+                        path = ""  # print the result instead
+            
+            if digits <= 10000 or not path:
+                print(f"Result: {n}! = ", end="")
+                write_decimal(result, separator=True)
+                print()
+            print(f"Number of digits: {digits:,}")
             print("="*60)
         
         elif choice == '2':
@@ -231,12 +1198,15 @@ def main():
             # Compare methods
             n = get_valid_number()
             
-            if n > 100:
-                print("\n⚠️ Large number! Limiting to 100 for fair comparison.")
-                print("(Recursion has stack limits in Python)")
-                n = 100
+            if n > 100000:
+                print("\n⚠️ Large number! Limiting to 100,000 for a quick comparison.")
+                n = 100000
+            if n > RECURSION_SAFE_LIMIT:
+                print("(Plain recursion hits Python's stack limit - only the split version runs)")
             
-            compare_methods(n)
+            default_workers = os.cpu_count() or 1
+            workers = input(f"Worker processes for the parallel method (default {default_workers}): ").strip()
+            compare_methods(n, workers=int(workers) if workers.isdigit() and int(workers) > 0 else None)
         
         elif choice == '4':
             # Factorial facts
@@ -244,6 +1214,45 @@ def main():
             factorial_facts(n)
         
         elif choice == '5':
+            # n-sweep: 10, 20, 40, ... up to the chosen n
+            n = get_valid_number()
+            sizes = []
+            size = 10
+            while size <= max(n, 10):
+                sizes.append(size)
+                size *= 2
+            
+            csv_path = input("Save CSV to (leave empty to skip): ").strip() or None
+            benchmark_sweep(sizes, csv_path=csv_path)
+        
+        elif choice == '6':
+            # Modular combinatorics
+            try:
+                n = int(input("\nn = "))
+                k = int(input("k = "))
+                m = int(input("Modulus m (e.g. 1000000007): "))
+                
+                if n < 0 or m < 1:
+                    print("❌ Need n ≥ 0 and m ≥ 1!")
+                else:
+                    print(f"\n{n}! mod {m} = {factorial_mod(n, m)}")
+                    print(f"C({n}, {k}) mod {m} = {binomial(n, k, m)}")
+            
+            except ValueError:
+                print("❌ Invalid input!")
+        
+        elif choice == '7':
+            # Persistent cache
+            directory = input("\nCache directory (default factorial_cache): ").strip() or "factorial_cache"
+            try:
+                size_mb = int(input("Maximum size in MB (default 256): ").strip() or 256)
+                cache = enable_disk_cache(directory, size_mb * 2**20)
+                print(f"\n✅ Disk cache enabled in {directory} ({len(cache.cached_values())} factorials cached)")
+                print(f"Factorials of n ≥ {DISK_CACHE_MIN_N:,} are now saved and reused across runs.")
+            except (ValueError, OSError) as e:
+                print(f"❌ {e}")
+        
+        elif choice == '8':
             print("\n👋 Thanks for calculating! Goodbye!")
             break
         
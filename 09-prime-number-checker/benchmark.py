@@ -0,0 +1,237 @@
+"""
+Prime Number Checker - Benchmark Harness
+========================================
+Measure every primality test and sieve in main.py on the same inputs.
+
+🎯 LEARNING OBJECTIVES:
+- Time code reliably with timeit (auto-ranging, repeats, best/median)
+- Measure peak memory with tracemalloc
+- Make benchmarks reproducible with a fixed random seed
+- Save machine-readable results (JSON) to track regressions
+
+Usage:
+    python benchmark.py                       # print a table
+    python benchmark.py --output bench.json   # also save JSON
+    python benchmark.py --seed 7 --repeat 7 --size 2000
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+
+import main
+
+# Carmichael numbers fool the Fermat test for every coprime base
+CARMICHAEL_NUMBERS = [
+    561, 1105, 1729, 2465, 2821, 6601, 8911, 10585, 15841, 29341,
+    41041, 46657, 52633, 62745, 63973, 75361, 101101, 115921, 126217,
+    162401, 172081, 188461, 252601, 278545, 294409, 314821, 334153,
+    340561, 399001, 410041, 449065, 488881, 512461,
+]
+
+# Largest input each primality strategy is expected to finish in reasonable time
+PRIMALITY_STRATEGIES = {
+    'basic': (main.is_prime_basic, 10**5),
+    'optimized': (main.is_prime_optimized, 10**12),
+    'miller_rabin': (main.is_prime_miller_rabin, None),
+}
+
+# Sieve strategies map (start, end) to the primes in between, plus the
+# largest end each one is expected to handle in reasonable time
+SIEVE_STRATEGIES = {
+    'classic': (lambda start, end: [p for p in main.sieve_of_eratosthenes(end) if p >= start], 10**8),
+    'segmented': (lambda start, end: [p for p in main.segmented_sieve(end) if p >= start], 10**8),
+    'trial_division': (main.find_primes_in_range, 10**7),
+    'parallel': (main.find_primes_in_range_parallel, None),
+}
+
+def chernick_carmichael_numbers(count):
+    """
+    Generate large Carmichael numbers (6k+1)(12k+1)(18k+1).
+    
+    LEARNING: Chernick's form is a Carmichael number whenever all
+    three factors are prime.
+    """
+    numbers = []
+    k = 1
+    while len(numbers) < count:
+        factors = (6 * k + 1, 12 * k + 1, 18 * k + 1)
+        if all(main.is_prime_miller_rabin(f) for f in factors):
+            numbers.append(factors[0] * factors[1] * factors[2])
+        k += 1
+    return numbers
+
+def make_distributions(seed, size):
+    """
+    Build the reproducible input sets for the primality tests.
+    """
+    rng = random.Random(seed)
+    return {
+        'small': [rng.randrange(2, 10**4) for _ in range(size)],
+        'random_64bit': [rng.getrandbits(64) | 1 for _ in range(size)],
+        'carmichael': CARMICHAEL_NUMBERS + chernick_carmichael_numbers(size // 10 or 1),
+    }
+
+def make_ranges(seed, width):
+    """
+    Build the dense ranges used by the sieve strategies.
+    """
+    rng = random.Random(seed)
+    offset = rng.randrange(10**9, 2 * 10**9)
+    return {
+        'dense_low': (0, width),
+        'dense_high': (offset, offset + width),
+    }
+
+def measure(workload, repeat):
+    """
+    Time a zero-argument workload and record its peak memory.
+    
+    LEARNING: timeit.autorange() picks a loop count that runs for at
+    least 0.2 s; repeating and keeping the best run filters out noise.
+    tracemalloc runs separately because it slows the code down.
+    """
+    timer = timeit.Timer(workload)
+    number, _ = timer.autorange()
+    runs = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    
+    tracemalloc.start()
+    workload()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {
+        'best_s': min(runs),
+        'median_s': statistics.median(runs),
+        'peak_bytes': peak,
+    }
+
+def bench_primality(distributions, repeat):
+    """
+    Benchmark every primality strategy on every input distribution.
+    """
+    results = []
+    for name, (is_prime, max_value) in PRIMALITY_STRATEGIES.items():
+        for dist, numbers in distributions.items():
+            if max_value is not None and max(numbers) > max_value:
+                results.append({'strategy': name, 'distribution': dist, 'skipped': True})
+                continue
+            
+            stats = measure(lambda: [is_prime(n) for n in numbers], repeat)
+            stats['ops_per_sec'] = len(numbers) / stats['best_s']
+            results.append({'strategy': name, 'distribution': dist,
+                            'inputs': len(numbers), **stats})
+    
+    # The batch API processes a whole distribution per call
+    for dist, numbers in distributions.items():
+        stats = measure(lambda: main.check_many(numbers), repeat)
+        stats['ops_per_sec'] = len(numbers) / stats['best_s']
+        results.append({'strategy': 'check_many', 'distribution': dist,
+                        'inputs': len(numbers), **stats})
+    
+    return results
+
+def bench_sieves(strategies, ranges, repeat):
+    """
+    Benchmark every sieve strategy on every dense range.
+    
+    ops_per_sec counts numbers covered by the range per second.
+    """
+    results = []
+    for name, (sieve, max_end) in strategies.items():
+        for dist, (start, end) in ranges.items():
+            if max_end is not None and end > max_end:
+                results.append({'strategy': name, 'distribution': dist, 'skipped': True})
+                continue
+            
+            stats = measure(lambda: sieve(start, end), repeat)
+            stats['ops_per_sec'] = (end - start + 1) / stats['best_s']
+            results.append({'strategy': name, 'distribution': dist,
+                            'inputs': end - start + 1, **stats})
+    
+    return results
+
+def run_benchmarks(seed=42, repeat=5, size=1000, width=10**6, table_path=None):
+    """
+    Run the whole suite and return a JSON-serializable report.
+    """
+    if main._prime_table is not None:
+        raise RuntimeError("Unload the prime table first - it would skew the results")
+    
+    distributions = make_distributions(seed, size)
+    ranges = make_ranges(seed, width)
+    results = bench_primality(distributions, repeat)
+    
+    if table_path:
+        # Table lookups only cover up to the table limit, so build one per run
+        largest = max(end for _, end in ranges.values())
+        main.build_prime_table(table_path, largest)
+        with main.PrimeTable(table_path) as table:
+            strategies = dict(SIEVE_STRATEGIES, prime_table=(table.primes_in_range, None))
+            results += bench_sieves(strategies, ranges, repeat)
+    else:
+        results += bench_sieves(SIEVE_STRATEGIES, ranges, repeat)
+    
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'numpy': main.np.__version__ if main.np is not None else None,
+            'seed': seed,
+            'repeat': repeat,
+            'size': size,
+            'width': width,
+        },
+        'results': results,
+    }
+
+def display_report(report):
+    """
+    Print the results as a table.
+    """
+    print("\n" + "="*78)
+    print("⏱️  PRIME BENCHMARKS")
+    print("="*78)
+    print(f"{'Strategy':<16} {'Distribution':<14} {'ops/sec':>14} {'best (s)':>12} {'peak memory':>14}")
+    print("-"*78)
+    
+    for row in report['results']:
+        if row.get('skipped'):
+            print(f"{row['strategy']:<16} {row['distribution']:<14} {'skipped':>14}")
+            continue
+        print(f"{row['strategy']:<16} {row['distribution']:<14} "
+              f"{row['ops_per_sec']:>14,.0f} {row['best_s']:>12.6f} "
+              f"{row['peak_bytes'] / 1024:>11,.1f} KB")
+    
+    print("="*78)
+
+def main_cli():
+    """
+    Parse command-line options, run the suite and report.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark prime checking and sieve strategies")
+    parser.add_argument('--seed', type=int, default=42, help="random seed for the inputs")
+    parser.add_argument('--repeat', type=int, default=5, help="timing repetitions per case")
+    parser.add_argument('--size', type=int, default=1000, help="numbers per primality distribution")
+    parser.add_argument('--width', type=int, default=10**6, help="width of the dense sieve ranges")
+    parser.add_argument('--table', metavar='PATH', help="also benchmark a prime table built at PATH")
+    parser.add_argument('--output', metavar='PATH', help="write the results as JSON")
+    args = parser.parse_args()
+    
+    report = run_benchmarks(args.seed, args.repeat, args.size, args.width, args.table)
+    display_report(report)
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+
+if __name__ == "__main__":
+    main_cli()
@@ -16,9 +16,47 @@ Check if numbers are prime and find prime numbers in ranges.
 - Boolean logic
 - Range operations
 - List comprehensions for filtering
+- Segmented sieving with compact bytearrays
 """
 
 import math
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, cycle, islice
+
+# NumPy is optional - the sieve falls back to pure Python without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Small primes used to pre-filter candidates before Miller-Rabin
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+                53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+# The first 13 primes as Miller-Rabin bases give an exact answer below this
+MILLER_RABIN_BASES = SMALL_PRIMES[:13]
+MILLER_RABIN_LIMIT = 3317044064679887385961981
+
+# Trial division stops here; larger cofactors go to Pollard's rho
+TRIAL_DIVISION_LIMIT = 10_000
+
+# 2·3·5·7 wheel: numbers coprime to 210, stored as gaps starting from 11
+_WHEEL_RESIDUES = [r for r in range(11, 221) if all(r % p for p in (2, 3, 5, 7))]
+WHEEL_GAPS = [b - a for a, b in zip(_WHEEL_RESIDUES, _WHEEL_RESIDUES[1:] + [_WHEEL_RESIDUES[0] + 210])]
+
+# Prime table file layout: magic + limit header, then one bit per odd number
+PRIME_TABLE_MAGIC = b'PRIMEBIT'
+PRIME_TABLE_HEADER = struct.Struct('<8sQ')
+DEFAULT_PRIME_TABLE = "primes.bin"
+
+# Prime table loaded by load_prime_table(), consulted by the prime checks
+_prime_table = None
+
+# Odd numbers per sieve window (~256 KB bytearray, sized to stay in L2 cache)
+SEGMENT_SIZE = 1 << 18
 
 def is_prime_basic(n):
     """
@@ -42,6 +80,8 @@ def is_prime_optimized(n):
     LEARNING: Only need to check up to sqrt(n)
     If n = a × b and a ≤ b, then a ≤ sqrt(n)
     """
+    if _table_covers(n):
+        return _prime_table.is_prime(n)
     if n < 2:
         return False
     if n == 2:
@@ -56,6 +96,182 @@ def is_prime_optimized(n):
     
     return True
 
+def _is_strong_probable_prime(n, base):
+    """
+    Miller-Rabin round: check odd n against a single base.
+    
+    LEARNING: Write n-1 = d × 2^s. For a prime n, base^d is 1 or one of
+    the repeated squarings hits n-1 (Fermat's little theorem).
+    """
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    x = pow(base, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    
+    return False
+
+def _jacobi(a, n):
+    """
+    Jacobi symbol (a/n) for odd positive n.
+    """
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+def _is_strong_lucas_probable_prime(n):
+    """
+    Strong Lucas probable prime test with Selfridge's parameters.
+    
+    LEARNING: Together with a base-2 Miller-Rabin round this forms the
+    Baillie-PSW test - no composite number is known to pass both.
+    """
+    if math.isqrt(n) ** 2 == n:
+        return False
+    
+    # Find the first D in 5, -7, 9, -11, ... with Jacobi symbol (D/n) = -1
+    D = 5
+    while True:
+        j = _jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    
+    P = 1
+    Q = (1 - D) // 4
+    
+    d = n + 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    # Walk the bits of d to get U_d, V_d and Q^d (mod n)
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U = U * V % n
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        
+        if bit == '1':
+            U, V = (P * U + V) % n, (D * U + P * V) % n
+            # Divide by 2 modulo odd n
+            if U % 2:
+                U += n
+            if V % 2:
+                V += n
+            U //= 2
+            V //= 2
+            Qk = Qk * Q % n
+    
+    if U == 0 or V == 0:
+        return True
+    
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    
+    return False
+
+def is_prime_miller_rabin(n):
+    """
+    Check if a number is prime using the Miller-Rabin test.
+    
+    LEARNING: Probabilistic tests made exact
+    - Small primes are divided out first (cheap and catches most composites)
+    - Below 3.3 × 10^24 the first 13 prime bases are proven to be exact
+    - Beyond that, Baillie-PSW (Miller-Rabin base 2 + strong Lucas) is used
+    Each round costs O(log n) multiplications instead of O(sqrt(n)) divisions.
+    """
+    if _table_covers(n):
+        return _prime_table.is_prime(n)
+    if n < 2:
+        return False
+    
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    
+    # No factor up to 97 and n < 97² means n is prime
+    if n < SMALL_PRIMES[-1] ** 2:
+        return True
+    
+    if n < MILLER_RABIN_LIMIT:
+        return all(_is_strong_probable_prime(n, a) for a in MILLER_RABIN_BASES)
+    
+    return _is_strong_probable_prime(n, 2) and _is_strong_lucas_probable_prime(n)
+
+# check_many() answers numbers up to this bound from one shared sieve
+BATCH_SIEVE_LIMIT = 10**7
+
+def _prime_flags(limit):
+    """
+    Return a bytearray where flags[n] is 1 exactly when n is prime.
+    """
+    flags = bytearray([1]) * (limit + 1)
+    flags[:2] = bytes(min(2, limit + 1))
+    
+    for p in range(2, math.isqrt(limit) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    
+    return flags
+
+def check_many(numbers):
+    """
+    Check a whole batch of numbers, returning True/False in input order.
+    
+    LEARNING: Batch processing - shared work is done once per batch
+    - Duplicates are tested only once
+    - Numbers up to BATCH_SIEVE_LIMIT are looked up in a single sieve
+      that only reaches as far as the largest of them
+    - Larger numbers go through Miller-Rabin
+    """
+    numbers = list(numbers)
+    unique = set(numbers)
+    small = [n for n in unique if n <= BATCH_SIEVE_LIMIT]
+    flags = _prime_flags(max(small)) if small and max(small) >= 2 else b''
+    
+    results = {}
+    for n in sorted(unique):
+        if n < 2:
+            results[n] = False
+        elif n <= BATCH_SIEVE_LIMIT:
+            results[n] = bool(flags[n])
+        else:
+            results[n] = is_prime_miller_rabin(n)
+    
+    return [results[n] for n in numbers]
+
+# Primality tests selectable from the menu
+PRIMALITY_METHODS = {
+    '1': ("Basic (divide by 2..n-1)", is_prime_basic),
+    '2': ("Optimized (divide up to √n)", is_prime_optimized),
+    '3': ("Miller-Rabin", is_prime_miller_rabin),
+}
+
 def find_prime_factors(n):
     """
     Find all prime factors of a number.
@@ -81,12 +297,102 @@ def find_prime_factors(n):
     
     return factors
 
+def _pollard_brent(n):
+    """
+    Find a non-trivial factor of an odd composite n (Brent's variant of rho).
+    
+    LEARNING: Pollard's rho
+    The sequence x -> x² + c (mod n) eventually cycles modulo each prime
+    factor p, usually after about sqrt(p) steps. gcd(|x - y|, n) exposes p
+    as soon as the cycle is detected. Brent batches the gcds to save time.
+    """
+    batch = 128
+    for c in range(1, n):
+        y, r, q, g = 2, 1, 1, 1
+        x = ys = y
+        
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += batch
+            r *= 2
+        
+        if g == n:
+            # The batch overshot - step back one value at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        
+        if g != n:
+            return g
+    
+    return n
+
+def find_prime_factors_fast(n):
+    """
+    Find all prime factors of a number, fast enough for 20+ digit inputs.
+    
+    LEARNING: Combining algorithms
+    1. Divide out the small primes from a precomputed table
+    2. Trial-divide with a 2·3·5·7 wheel (skips 77% of candidates),
+       shrinking the sqrt bound every time a factor is removed
+    3. Split whatever is left with Miller-Rabin + Pollard's rho
+    """
+    factors = []
+    if n < 2:
+        return factors
+    
+    for p in SMALL_PRIMES:
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    
+    # Wheel trial division from 101 (the first prime after the table)
+    candidate = 11
+    gaps = cycle(WHEEL_GAPS)
+    while candidate < 101:
+        candidate += next(gaps)
+    
+    bound = min(math.isqrt(n), TRIAL_DIVISION_LIMIT)
+    while candidate <= bound:
+        if n % candidate == 0:
+            while n % candidate == 0:
+                factors.append(candidate)
+                n //= candidate
+            bound = min(math.isqrt(n), TRIAL_DIVISION_LIMIT)
+        candidate += next(gaps)
+    
+    # Split large cofactors until only primes remain
+    pending = [n] if n > 1 else []
+    while pending:
+        m = pending.pop()
+        if is_prime_miller_rabin(m):
+            factors.append(m)
+        else:
+            d = _pollard_brent(m)
+            pending.extend((d, m // d))
+    
+    return sorted(factors)
+
 def find_primes_in_range(start, end):
     """
     Find all prime numbers in a range.
     
     LEARNING: Applying prime check to multiple numbers
     """
+    if _table_covers(end):
+        return _prime_table.primes_in_range(start, end)
+    
     primes = []
     for num in range(start, end + 1):
         if is_prime_optimized(num):
@@ -98,10 +404,18 @@ def sieve_of_eratosthenes(limit):
     Find all primes up to limit using Sieve of Eratosthenes.
     
     LEARNING: Ancient algorithm (most efficient for finding many primes)
+    Uses the NumPy backend when NumPy is installed, pure Python otherwise.
     """
     if limit < 2:
         return []
-    
+    if np is not None:
+        return _sieve_numpy(limit)
+    return _sieve_pure_python(limit)
+
+def _sieve_pure_python(limit):
+    """
+    Pure-Python Sieve of Eratosthenes (limit must be at least 2).
+    """
     # Create boolean array "prime[0..limit]" and initialize all as true
     prime = [True] * (limit + 1)
     prime[0] = prime[1] = False
@@ -118,6 +432,411 @@ def sieve_of_eratosthenes(limit):
     # Collect all prime numbers
     return [num for num, is_prime in enumerate(prime) if is_prime]
 
+def _sieve_numpy(limit):
+    """
+    Vectorized Sieve of Eratosthenes (limit must be at least 2).
+    
+    LEARNING: Vectorization - one strided slice assignment marks every
+    multiple of p in C, and np.flatnonzero collects the primes without
+    a Python-level loop.
+    """
+    prime = np.ones(limit + 1, dtype=bool)
+    prime[:2] = False
+    
+    for p in range(2, math.isqrt(limit) + 1):
+        if prime[p]:
+            prime[p * p::p] = False
+    
+    return np.flatnonzero(prime).tolist()
+
+def _odd_base_primes(limit):
+    """
+    Return the odd primes up to sqrt(limit), used to cross off composites.
+    """
+    return sieve_of_eratosthenes(math.isqrt(limit))[1:]
+
+def _sieve_odd_segment(low, high, base_primes):
+    """
+    Sieve the odd numbers in [low, high), where low is odd and at least 3.
+    
+    LEARNING: Odd-only storage - index i stands for low + 2*i, so even
+    numbers take no memory. Slice assignment crosses off every multiple
+    of p in a single C-level operation instead of a Python loop.
+    """
+    size = (high - low + 1) // 2
+    segment = bytearray(b'\x01') * size
+    zeros = memoryview(bytes(size))
+    
+    for p in base_primes:
+        square = p * p
+        if square >= high:
+            break
+        
+        # First odd multiple of p inside the window (never below p*p)
+        first = max(square, (low + p - 1) // p * p)
+        if first % 2 == 0:
+            first += p
+        
+        index = (first - low) // 2
+        if index < size:
+            # Consecutive odd multiples are 2p apart, i.e. p slots apart
+            segment[index::p] = zeros[:len(range(index, size, p))]
+    
+    return segment
+
+def _primes_in_segment(low, high, base_primes):
+    """
+    Return the primes in [low, high) using one sieve window.
+    
+    base_primes must hold the odd primes up to sqrt(high).
+    """
+    primes = [2] if low <= 2 < high else []
+    low = max(low, 3) | 1
+    
+    if low < high:
+        segment = _sieve_odd_segment(low, high, base_primes)
+        primes.extend(compress(range(low, high, 2), segment))
+    
+    return primes
+
+def segmented_sieve(limit, segment_size=SEGMENT_SIZE):
+    """
+    Find all primes up to limit, one cache-sized window at a time.
+    
+    LEARNING: Segmented Sieve of Eratosthenes
+    Only the primes up to sqrt(limit) are kept in full; the rest of the
+    range is processed in small windows, so the working memory stays
+    bounded no matter how large the limit is.
+    """
+    if limit < 2:
+        return []
+    
+    base_primes = _odd_base_primes(limit)
+    primes = []
+    span = 2 * segment_size
+    
+    for low in range(0, limit + 1, span):
+        high = min(low + span, limit + 1)
+        primes.extend(_primes_in_segment(low, high, base_primes))
+    
+    return primes
+
+def iter_primes(start=2, segment_size=SEGMENT_SIZE):
+    """
+    Yield primes >= start forever, one sieve window at a time.
+    
+    LEARNING: Generators - values are produced lazily, so callers can
+    stream, count, or stop early without holding every prime in memory.
+    Only the base primes up to sqrt(current position) are kept.
+    """
+    low = max(start, 0)
+    span = 2 * segment_size
+    base_limit = 0
+    base_primes = []
+    
+    while True:
+        high = low + span
+        
+        # Grow the base primes when the window passes the old bound
+        if base_limit * base_limit < high:
+            base_limit = max(2 * base_limit, math.isqrt(high) + 1)
+            base_primes = sieve_of_eratosthenes(base_limit)[1:]
+        
+        yield from _primes_in_segment(low, high, base_primes)
+        low = high
+
+def first_n_primes(n):
+    """
+    Return the first n prime numbers.
+    
+    LEARNING: itertools.islice takes a fixed number of items from a generator
+    """
+    return list(islice(iter_primes(), max(n, 0)))
+
+def prime_count(x):
+    """
+    Count the primes up to x without listing them: π(x).
+    
+    LEARNING: Lucy Hedgehog's method (a Legendre-style prime count)
+    Only the values x // k matter - there are about 2·sqrt(x) of them.
+    Each prime p "sieves" these counts at once:
+        S(v) -= S(v // p) - (number of primes below p)
+    so the work is about x^(3/4) and the memory about sqrt(x).
+    """
+    if x < 2:
+        return 0
+    if np is not None and x < 2**62:
+        return _prime_count_numpy(x)
+    return _prime_count_pure_python(x)
+
+def _prime_count_pure_python(x):
+    """
+    Pure-Python Lucy Hedgehog prime count (x must be at least 2).
+    """
+    r = math.isqrt(x)
+    # small[v] counts survivors in [2, v]; large[i] counts survivors in [2, x // i]
+    small = [v - 1 for v in range(r + 1)]
+    large = [0] + [x // i - 1 for i in range(1, r + 1)]
+    
+    for below, p in enumerate(sieve_of_eratosthenes(r)):
+        square = p * p
+        xp = x // p
+        end = min(r, x // square)
+        mid = min(end, r // p)
+        
+        # Each right-hand side reads only old values, so whole slices can be updated
+        large[1:mid + 1] = [large[i] - large[i * p] + below for i in range(1, mid + 1)]
+        large[mid + 1:end + 1] = [large[i] - small[xp // i] + below for i in range(mid + 1, end + 1)]
+        if square <= r:
+            small[square:] = [small[v] - small[v // p] + below for v in range(square, r + 1)]
+    
+    return large[1]
+
+def _prime_count_numpy(x):
+    """
+    Vectorized Lucy Hedgehog prime count (2 <= x < 2^62).
+    """
+    r = math.isqrt(x)
+    small = np.arange(-1, r, dtype=np.int64)
+    large = np.zeros(r + 1, dtype=np.int64)
+    large[1:] = x // np.arange(1, r + 1, dtype=np.int64) - 1
+    
+    for below, p in enumerate(sieve_of_eratosthenes(r)):
+        square = p * p
+        xp = x // p
+        end = min(r, x // square)
+        mid = min(end, r // p)
+        
+        large[1:mid + 1] -= large[p:mid * p + 1:p] - below
+        if end > mid:
+            large[mid + 1:end + 1] -= small[xp // np.arange(mid + 1, end + 1, dtype=np.int64)] - below
+        if square <= r:
+            small[square:] -= small[np.arange(square, r + 1, dtype=np.int64) // p] - below
+    
+    return int(large[1])
+
+def nth_prime(n):
+    """
+    Return the nth prime number (nth_prime(1) == 2).
+    
+    LEARNING: Estimate, then correct
+    1. Cipolla's formula guesses p(n) ≈ n(ln n + ln ln n - 1 + ...)
+    2. π(x) tells how far off the guess is; Newton steps using the
+       average prime gap ln(x) move it close
+    3. A short sieve walk finishes the job
+    """
+    if n < 1:
+        raise ValueError("n must be at least 1")
+    if n < 6:
+        return (2, 3, 5, 7, 11)[n - 1]
+    
+    ln = math.log(n)
+    lnln = math.log(ln)
+    x = int(n * (ln + lnln - 1 + (lnln - 2) / ln))
+    count = prime_count(x)
+    
+    while abs(n - count) > 1000:
+        x += int((n - count) * math.log(x))
+        count = prime_count(x)
+    
+    # Make sure we are below the target, then walk forward
+    while count >= n:
+        x = max(2, x - int((count - n + 1) * math.log(x)) - 1)
+        count = prime_count(x)
+    
+    return next(islice(iter_primes(x + 1), n - count - 1, None))
+
+# Base primes shared by every worker process (set once per worker)
+_worker_base_primes = []
+
+def _init_range_worker(base_primes):
+    """
+    Process pool initializer: receive the base primes once per worker.
+    """
+    global _worker_base_primes
+    _worker_base_primes = base_primes
+
+def _range_worker(bounds):
+    """
+    Sieve one segment [low, high) inside a worker process.
+    """
+    low, high = bounds
+    return _primes_in_segment(low, high, _worker_base_primes)
+
+def find_primes_in_range_parallel(start, end, workers=None, segment_size=SEGMENT_SIZE):
+    """
+    Find all prime numbers in a range using several CPU cores.
+    
+    LEARNING: Parallel processing
+    - The range is split into independent segments
+    - Base primes up to sqrt(end) are computed once and sent to each worker
+    - pool.map() returns the segments in order, so merging is just extend()
+    """
+    start = max(start, 0)
+    if end < max(start, 2):
+        return []
+    
+    workers = workers or os.cpu_count() or 1
+    base_primes = _odd_base_primes(end)
+    span = 2 * segment_size
+    bounds = [(low, min(low + span, end + 1)) for low in range(start, end + 1, span)]
+    
+    primes = []
+    if workers == 1 or len(bounds) == 1:
+        for low, high in bounds:
+            primes.extend(_primes_in_segment(low, high, base_primes))
+        return primes
+    
+    # A few chunks per worker keeps cores busy without much pickling overhead
+    chunksize = max(1, len(bounds) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_range_worker,
+                             initargs=(base_primes,)) as pool:
+        for segment_primes in pool.map(_range_worker, bounds, chunksize=chunksize):
+            primes.extend(segment_primes)
+    
+    return primes
+
+# Sieve implementations selectable from the menu
+SIEVE_METHODS = {
+    '1': ("Classic sieve", sieve_of_eratosthenes),
+    '2': ("Segmented sieve", segmented_sieve),
+}
+
+# Bytes <-> '0'/'1' digits, used to pack sieve flags into bits and back
+_FLAGS_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+_DIGITS_TO_FLAGS = bytes.maketrans(b'01', b'\x00\x01')
+
+def build_prime_table(path=DEFAULT_PRIME_TABLE, limit=10**8, segment_size=SEGMENT_SIZE):
+    """
+    Sieve up to limit once and save the result as an odd-only bitmap.
+    
+    LEARNING: Bit packing - bit i of the bitmap says whether 2i+1 is prime,
+    so 10^9 numbers fit in about 60 MB.
+    """
+    if limit < 2:
+        raise ValueError("Table limit must be at least 2")
+    
+    segment_size -= segment_size % 8  # keep windows byte-aligned
+    base_primes = _odd_base_primes(limit)
+    span = 2 * segment_size
+    
+    with open(path, 'wb') as f:
+        f.write(PRIME_TABLE_HEADER.pack(PRIME_TABLE_MAGIC, limit))
+        
+        for low in range(1, limit + 1, span):
+            high = min(low + span, limit + 1)
+            flags = _sieve_odd_segment(low, high, base_primes)
+            if low == 1:
+                flags[0] = 0  # 1 is not prime
+            
+            # Reversed '0'/'1' digits parse as an int whose bit i is flags[i]
+            bits = int(flags.translate(_FLAGS_TO_DIGITS)[::-1], 2)
+            f.write(bits.to_bytes((len(flags) + 7) // 8, 'little'))
+    
+    return path
+
+class PrimeTable:
+    """
+    Read-only view of a prime bitmap file built by build_prime_table().
+    
+    LEARNING: Memory-mapped files - the OS pages the file in on demand,
+    so opening even a huge table is instant and lookups are O(1) bit tests.
+    """
+    
+    def __init__(self, path=DEFAULT_PRIME_TABLE):
+        self._file = open(path, 'rb')
+        self._map = None
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < PRIME_TABLE_HEADER.size:
+                raise ValueError(f"{path} is not a prime table file")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            
+            magic, self.limit = PRIME_TABLE_HEADER.unpack_from(self._map)
+            if magic != PRIME_TABLE_MAGIC:
+                raise ValueError(f"{path} is not a prime table file")
+            
+            # One bit per odd number up to the limit
+            if size < PRIME_TABLE_HEADER.size + ((self.limit + 1) // 2 + 7) // 8:
+                raise ValueError(f"{path} is truncated")
+        except BaseException:
+            self.close()
+            raise
+    
+    def is_prime(self, n):
+        """
+        Look n up in the bitmap (n must not exceed the table limit).
+        """
+        if n > self.limit:
+            raise ValueError(f"{n} is beyond the table limit {self.limit}")
+        if n < 3 or n % 2 == 0:
+            return n == 2
+        
+        i = n // 2
+        return bool(self._map[PRIME_TABLE_HEADER.size + (i >> 3)] >> (i & 7) & 1)
+    
+    __contains__ = is_prime
+    
+    def primes_in_range(self, start, end, block_size=SEGMENT_SIZE):
+        """
+        Return the primes in [start, end] by scanning the mapped bitmap.
+        """
+        end = min(end, self.limit)
+        primes = [2] if start <= 2 <= end else []
+        
+        first = max(start, 3) | 1
+        last = end if end % 2 else end - 1
+        if first > last:
+            return primes
+        
+        # Scan whole bytes; bit j of byte b stands for 16b + 2j + 1
+        first_byte = (first // 2) >> 3
+        last_byte = (last // 2) >> 3
+        header = PRIME_TABLE_HEADER.size
+        
+        for b in range(first_byte, last_byte + 1, block_size):
+            chunk = self._map[header + b:header + min(b + block_size, last_byte + 1)]
+            nbits = len(chunk) * 8
+            digits = format(int.from_bytes(chunk, 'little'), f'0{nbits}b')[::-1]
+            flags = digits.encode().translate(_DIGITS_TO_FLAGS)
+            
+            low = 16 * b + 1
+            numbers = range(low, low + 2 * nbits, 2)
+            primes.extend(p for p in compress(numbers, flags) if first <= p <= last)
+        
+        return primes
+    
+    def close(self):
+        """
+        Unmap the bitmap and close the file.
+        """
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+def load_prime_table(path=DEFAULT_PRIME_TABLE):
+    """
+    Memory-map a saved prime table and use it for lookups below its limit.
+    """
+    global _prime_table
+    if _prime_table is not None:
+        _prime_table.close()
+    _prime_table = PrimeTable(path)
+    return _prime_table
+
+def _table_covers(n):
+    """
+    True when a loaded prime table can answer for n directly.
+    """
+    return _prime_table is not None and n <= _prime_table.limit
+
 def display_prime_table(primes):
     """
     Display primes in a formatted table.
@@ -148,8 +867,7 @@ def prime_number_facts(n):
         print("✅ This IS a prime number!")
         
         # Find position among primes
-        primes_up_to_n = sieve_of_eratosthenes(n)
-        position = len(primes_up_to_n)
+        position = prime_count(n)
         print(f"Position: {position}th prime number")
         
         # Twin prime check
@@ -166,7 +884,7 @@ def prime_number_facts(n):
         print("❌ This is NOT a prime number")
         
         # Show factorization
-        factors = find_prime_factors(n)
+        factors = find_prime_factors_fast(n)
         print(f"Prime factorization: {' × '.join(map(str, factors))}")
         
         # Show all divisors
@@ -197,21 +915,36 @@ def main():
         print("3. Find prime factors")
         print("4. First N prime numbers")
         print("5. Prime number facts")
-        print("6. Exit")
+        print("6. Sieve primes up to a limit")
+        print("7. Build or load a prime table file")
+        print("8. Check many numbers at once")
+        print("9. Count primes π(x) / find the nth prime")
+        print("10. Exit")
         
-        choice = input("\nEnter choice (1-6): ").strip()
+        choice = input("\nEnter choice (1-10): ").strip()
         
         if choice == '1':
             # Check single number
             try:
                 num = int(input("\nEnter a number to check: "))
                 
-                if is_prime_optimized(num):
+                print("\nPrimality test:")
+                for key, (name, _) in PRIMALITY_METHODS.items():
+                    print(f"{key}. {name}")
+                method = input("Select method (1-3, default 3): ").strip() or '3'
+                
+                if method not in PRIMALITY_METHODS:
+                    print("❌ Invalid method!")
+                    continue
+                
+                is_prime = PRIMALITY_METHODS[method][1]
+                
+                if is_prime(num):
                     print(f"\n✅ {num} IS a prime number!")
                 else:
                     print(f"\n❌ {num} is NOT a prime number")
                     if num > 1:
-                        factors = find_prime_factors(num)
+                        factors = find_prime_factors_fast(num)
                         print(f"Prime factorization: {' × '.join(map(str, factors))}")
             
             except ValueError:
@@ -223,10 +956,12 @@ def main():
                 start = int(input("\nStart of range: "))
                 end = int(input("End of range: "))
                 
-                if end - start > 10000:
-                    print("\n⚠️ Large range! This may take time...")
-                
-                primes = find_primes_in_range(start, end)
+                if end - start > 10000 and not _table_covers(end):
+                    workers = os.cpu_count() or 1
+                    print(f"\n⚠️ Large range! Sieving in parallel on {workers} core(s)...")
+                    primes = find_primes_in_range_parallel(start, end, workers)
+                else:
+                    primes = find_primes_in_range(start, end)
                 
                 if primes:
                     display_prime_table(primes)
@@ -244,7 +979,7 @@ def main():
                 if num < 2:
                     print("❌ Prime factorization is only for numbers ≥ 2")
                 else:
-                    factors = find_prime_factors(num)
+                    factors = find_prime_factors_fast(num)
                     print(f"\n{num} = {' × '.join(map(str, factors))}")
             
             except ValueError:
@@ -259,15 +994,8 @@ def main():
                     print("\n⚠️ Large number! Limiting to 10,000")
                     n = 10000
                 
-                # Find primes using sieve (estimate upper limit)
-                limit = max(n * 15, 100)  # Approximation
-                all_primes = sieve_of_eratosthenes(limit)
-                
-                while len(all_primes) < n:
-                    limit *= 2
-                    all_primes = sieve_of_eratosthenes(limit)
-                
-                primes = all_primes[:n]
+                # Stream primes lazily - no upper limit to estimate
+                primes = first_n_primes(n)
                 display_prime_table(primes)
             
             except ValueError:
@@ -282,6 +1010,81 @@ def main():
                 print("❌ Invalid input!")
         
         elif choice == '6':
+            # Sieve with a selectable implementation
+            try:
+                limit = int(input("\nFind primes up to: "))
+                
+                print("\nSieve method:")
+                for key, (name, _) in SIEVE_METHODS.items():
+                    print(f"{key}. {name}")
+                method = input("Select method (1-2): ").strip()
+                
+                if method not in SIEVE_METHODS:
+                    print("❌ Invalid method!")
+                    continue
+                
+                name, sieve = SIEVE_METHODS[method]
+                primes = sieve(limit)
+                
+                if len(primes) > 1000:
+                    print(f"\n{name}: {len(primes):,} primes up to {limit:,}")
+                    print(f"Largest: {primes[-1]:,}")
+                elif primes:
+                    display_prime_table(primes)
+                else:
+                    print(f"\n❌ No prime numbers up to {limit}")
+            
+            except ValueError:
+                print("❌ Invalid input!")
+        
+        elif choice == '7':
+            # Persistent prime table
+            path = input(f"\nTable file (default {DEFAULT_PRIME_TABLE}): ").strip() or DEFAULT_PRIME_TABLE
+            
+            try:
+                if not os.path.exists(path):
+                    limit = int(input("Build table up to: "))
+                    print("\n⏳ Building prime table...")
+                    build_prime_table(path, limit)
+                
+                table = load_prime_table(path)
+                print(f"\n✅ Loaded {path} (primes up to {table.limit:,})")
+                print("Lookups and ranges below this limit now use the table.")
+            
+            except (ValueError, OSError) as e:
+                print(f"❌ {e}")
+        
+        elif choice == '8':
+            # Batch check
+            try:
+                numbers = [int(x) for x in input("\nEnter numbers separated by spaces: ").split()]
+                
+                results = check_many(numbers)
+                for num, is_prime in zip(numbers, results):
+                    print(f"{'✅' if is_prime else '❌'} {num}")
+                print(f"\n{sum(results)} of {len(numbers)} numbers are prime")
+            
+            except ValueError:
+                print("❌ Invalid input!")
+        
+        elif choice == '9':
+            # Prime counting
+            try:
+                mode = input("\n1. Count primes up to x\n2. Find the nth prime\nSelect (1-2): ").strip()
+                
+                if mode == '1':
+                    x = int(input("x = "))
+                    print(f"\nπ({x:,}) = {prime_count(x):,}")
+                elif mode == '2':
+                    n = int(input("n = "))
+                    print(f"\nPrime #{n:,} is {nth_prime(n):,}")
+                else:
+                    print("❌ Invalid choice!")
+            
+            except ValueError as e:
+                print(f"❌ Invalid input! {e}")
+        
+        elif choice == '10':
             print("\n👋 Thanks for exploring prime numbers! Goodbye!")
             break
         
@@ -0,0 +1,128 @@
+"""
+Bank Account System - Registry Benchmark
+========================================
+Load a large number of accounts into a Bank and measure lookups and
+transfers by account number.
+
+🎯 LEARNING OBJECTIVES:
+- See O(1) dict lookups stay fast as the registry grows
+- Compare them with an O(n) linear search
+- Measure memory per account with tracemalloc
+
+Usage:
+    python benchmark.py                        # 1,000,000 accounts
+    python benchmark.py --accounts 100000 --seed 7
+"""
+
+import argparse
+import contextlib
+import csv
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from main import Bank
+
+def write_accounts_csv(path, count, seed):
+    """
+    Write count random accounts to a CSV file.
+    """
+    rng = random.Random(seed)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['account_holder', 'account_number', 'initial_balance'])
+        for i in range(count):
+            # Holders are drawn at random, so some own several accounts
+            writer.writerow([f"Holder {rng.randrange(count)}", f"ACC{i:08d}", rng.randrange(0, 10000)])
+
+def time_per_op(label, count, func):
+    """
+    Run func once (its own prints silenced), report ops/sec and return the seconds.
+    """
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+    print(f"{label:<32} {count:>12,} {elapsed:>10.3f} {count / elapsed:>15,.0f}")
+    return elapsed
+
+def measure_memory(path, sample):
+    """
+    Return the bytes per account for loading the first sample rows.
+    
+    LEARNING: tracemalloc slows allocation down, so it runs on a
+    smaller sample instead of the timed full-size load.
+    """
+    sample_path = path + '.sample'
+    with open(path, encoding='utf-8') as src, open(sample_path, 'w', encoding='utf-8') as dst:
+        for _ in range(sample + 1):  # + header
+            dst.write(src.readline())
+    
+    tracemalloc.start()
+    bank = Bank()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        bank.load_csv(sample_path)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    os.remove(sample_path)
+    return current / len(bank)
+
+def main_cli():
+    """
+    Parse command-line options, run the benchmark and report.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Bank account registry")
+    parser.add_argument('--accounts', type=int, default=10**6, help="number of accounts to load")
+    parser.add_argument('--lookups', type=int, default=10**6, help="random lookups by account number")
+    parser.add_argument('--transfers', type=int, default=10**5, help="random transfers by account number")
+    parser.add_argument('--seed', type=int, default=42, help="random seed")
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    bank = Bank()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'accounts.csv')
+        write_accounts_csv(path, args.accounts, args.seed)
+        
+        print("\n" + "="*72)
+        print(f"🏛️  BANK REGISTRY BENCHMARK ({args.accounts:,} accounts)")
+        print("="*72)
+        print(f"{'Operation':<32} {'Count':>12} {'Seconds':>10} {'Ops/sec':>15}")
+        print("-"*72)
+        
+        time_per_op("load_csv", args.accounts, lambda: bank.load_csv(path))
+        bytes_per_account = measure_memory(path, min(args.accounts, 10**5))
+    
+    numbers = [f"ACC{rng.randrange(args.accounts):08d}" for _ in range(args.lookups)]
+    time_per_op("get_account (dict, O(1))", args.lookups,
+                lambda: [bank.get_account(n) for n in numbers])
+    
+    holders = [f"Holder {rng.randrange(args.accounts)}" for _ in range(args.lookups)]
+    time_per_op("find_by_holder (dict, O(1))", args.lookups,
+                lambda: [bank.find_by_holder(h) for h in holders])
+    
+    # A linear scan is so slow that a few hundred searches are enough
+    accounts = list(bank)
+    scans = numbers[:200]
+    time_per_op("linear search (list, O(n))", len(scans),
+                lambda: [next(a for a in accounts if a.account_number == n) for n in scans])
+    
+    pairs = [(rng.choice(numbers), rng.choice(numbers), rng.randint(1, 500))
+             for _ in range(args.transfers)]
+    total_before = bank.total_balance()
+    time_per_op("transfer by account number", args.transfers,
+                lambda: [bank.transfer(a, b, amount) for a, b, amount in pairs if a != b])
+    
+    print("-"*72)
+    print(f"💾 Memory per account: {bytes_per_account:,.0f} bytes "
+          f"(~{bytes_per_account * args.accounts / 2**20:,.0f} MB for {args.accounts:,})")
+    conserved = bank.total_balance() == total_before
+    print(f"{'✅' if conserved else '❌'} Total balance {'conserved' if conserved else 'changed'} "
+          f"across transfers")
+    print("="*72)
+
+if __name__ == "__main__":
+    main_cli()
@@ -8,6 +8,275 @@ This project introduces core OOP concepts by building a simple banking system
 where you can create accounts, deposit, withdraw, and manage transactions.
 """
 
+import csv
+import json
+import math
+import os
+import threading
+import time
+from array import array
+
+# Ledger file used by the demo in main()
+LEDGER_PATH = "bank_ledger.jsonl"
+
+
+class TransactionLedger:
+    """
+    📒 Append-only Write-Ahead Ledger
+    
+    Durable record of every transaction, one JSON object per line (JSONL).
+    
+    LEARNING: Write-Ahead Logging
+    - Records are only ever appended, never changed, so a crash can at
+      worst cut off the very last line
+    - os.fsync() forces data onto the disk, but it is slow; "group commit"
+      syncs once per time window (or per max_pending records) instead of
+      after every single write; a timer syncs the tail of a burst
+    - On open, a torn last line left by a crash is cut off so new records
+      start on a fresh line
+    - Replaying the ledger from the start rebuilds every balance
+    - A lock serializes appends, so concurrent writers never interleave lines
+    """
+    
+    def __init__(self, path=LEDGER_PATH, group_commit_window=0.05, max_pending=1000):
+        self.path = path
+        self.group_commit_window = group_commit_window
+        self.max_pending = max_pending
+        self._repair_tail(path)
+        self._file = open(path, 'a', encoding='utf-8')
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._timer = None  # syncs pending records once the window ends
+        self._lock = threading.RLock()  # re-entrant: append() calls sync()
+    
+    @staticmethod
+    def _repair_tail(path, block_size=65536):
+        """
+        Truncate a ledger back to its last complete line, if needed.
+        """
+        if not os.path.exists(path):
+            return
+        
+        with open(path, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - block_size)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b'\n')
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            
+            if position != end:
+                f.truncate(position)
+    
+    def append(self, record):
+        """
+        Append one record; fsync when the group-commit window has passed.
+        """
+        self._write(json.dumps(record, separators=(',', ':')) + '\n', 1)
+    
+    def append_many(self, records):
+        """
+        Append a batch of records with a single write and at most one fsync.
+        """
+        lines = ''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records)
+        self._write(lines, len(records))
+    
+    def _write(self, lines, count):
+        """
+        Write count records, then sync now or schedule a timed sync.
+        """
+        with self._lock:
+            self._file.write(lines)
+            self._pending += count
+            
+            if (self._pending >= self.max_pending
+                    or time.monotonic() - self._last_sync >= self.group_commit_window):
+                self.sync()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.group_commit_window, self._timed_sync)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def _timed_sync(self):
+        """
+        Timer callback: sync whatever is still pending.
+        """
+        with self._lock:
+            self._timer = None
+            if self._pending and not self._file.closed:
+                self.sync()
+    
+    def sync(self):
+        """
+        Flush buffered records and force them onto the disk.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+            self._last_sync = time.monotonic()
+    
+    def close(self):
+        """
+        Sync outstanding records and close the file.
+        """
+        with self._lock:
+            if not self._file.closed:
+                self.sync()
+                self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @staticmethod
+    def replay(path=LEDGER_PATH):
+        """
+        Rebuild account state from a ledger file.
+        
+        Returns {account_number: {'holder': ..., 'balance': ...}}.
+        Each record carries the balance after it, so the last record of
+        an account is its current balance. A torn final line (from a
+        crash mid-write) is ignored; a bad line anywhere else means the
+        ledger is corrupt and raises ValueError.
+        """
+        accounts = {}
+        with open(path, encoding='utf-8') as f:
+            torn = None
+            for line_number, line in enumerate(f, start=1):
+                if torn is not None:
+                    raise ValueError(f"{path}: corrupt record on line {torn}")
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    torn = line_number
+                    continue
+                
+                state = accounts.setdefault(record['account'], {'holder': None, 'balance': 0})
+                if 'holder' in record:
+                    state['holder'] = record['holder']
+                state['balance'] = record['balance']
+        return accounts
+
+
+class TransactionLog:
+    """
+    🗃️ Compact Columnar Transaction Store
+    
+    Stores transactions column by column in typed arrays instead of one
+    dict per transaction.
+    
+    LEARNING: Memory-efficient data layout
+    - A dict with 4 keys plus a timestamp string costs hundreds of bytes;
+      here a transaction costs 28 bytes (8 + 8 + 8 + 4)
+    - array('d') / array('q') store raw numbers, not Python objects
+    - Transaction kinds ("Deposit", "Transfer to", ...) are "interned":
+      each kind is stored once and rows keep a small integer code
+    - The other account of a transfer goes in its own column, which is
+      only created once the first transfer happens
+    - __slots__ stops Python from giving each log a __dict__
+    Indexing, slicing or iterating still gives the familiar dicts, built
+    on demand.
+    """
+    
+    __slots__ = ('_amounts', '_balances', '_timestamps', '_types', '_counterparties')
+    
+    # Intern table shared by all logs: code -> name and name -> code
+    _type_names = []
+    _type_codes = {}
+    _intern_lock = threading.Lock()
+    
+    def __init__(self):
+        self._amounts = array('d')
+        self._balances = array('d')
+        self._timestamps = array('q')  # nanoseconds since the epoch
+        self._types = array('I')
+        self._counterparties = None  # list of account numbers (or None per row)
+    
+    @classmethod
+    def _type_code(cls, transaction_type):
+        """
+        Return the integer code for a type name, adding it if new.
+        """
+        code = cls._type_codes.get(transaction_type)
+        if code is None:
+            with cls._intern_lock:
+                # Check again: another thread may have added it meanwhile
+                code = cls._type_codes.get(transaction_type)
+                if code is None:
+                    code = len(cls._type_names)
+                    cls._type_names.append(transaction_type)
+                    cls._type_codes[transaction_type] = code
+        return code
+    
+    def append(self, transaction_type, amount, balance, timestamp_ns=None, counterparty=None):
+        """
+        Add one transaction (timestamp defaults to now).
+        
+        counterparty is the other account's number for transfers.
+        """
+        if counterparty is not None and self._counterparties is None:
+            self._counterparties = [None] * len(self)
+        if self._counterparties is not None:
+            self._counterparties.append(counterparty)
+        
+        self._types.append(self._type_code(transaction_type))
+        self._amounts.append(amount)
+        self._balances.append(balance)
+        self._timestamps.append(time.time_ns() if timestamp_ns is None else timestamp_ns)
+    
+    def extend(self, transaction_types, amounts, balances, timestamp_ns):
+        """
+        Add many transactions that share one timestamp.
+        
+        LEARNING: array.extend() copies whole columns at C speed; only
+        the handful of distinct type names need interning.
+        """
+        if self._counterparties is not None:
+            self._counterparties.extend([None] * len(amounts))
+        
+        codes = {name: self._type_code(name) for name in set(transaction_types)}
+        self._types.extend(map(codes.__getitem__, transaction_types))
+        self._amounts.extend(amounts)
+        self._balances.extend(balances)
+        self._timestamps.extend(array('q', [timestamp_ns]) * len(amounts))
+    
+    def __len__(self):
+        return len(self._types)
+    
+    def __getitem__(self, index):
+        """
+        Return transaction number index as a dict (a list of dicts for a slice).
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        
+        transaction_type = self._type_names[self._types[index]]
+        if self._counterparties is not None and self._counterparties[index] is not None:
+            transaction_type = f"{transaction_type} {self._counterparties[index]}"
+        
+        seconds = self._timestamps[index] / 1e9
+        return {
+            'type': transaction_type,
+            'amount': self._amounts[index],
+            'balance': self._balances[index],
+            'timestamp': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds)),
+        }
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
 class BankAccount:
     """
     🏦 BankAccount Class
@@ -17,11 +286,24 @@ class BankAccount:
     LEARNING: Classes and Objects
     - A class is a blueprint for creating objects
     - Objects are instances of a class with their own data
+    
+    LEARNING: Thread Safety
+    - Every account has its own lock guarding its balance and history
+    - A check-then-update (e.g. "enough money? then subtract") must
+      happen while holding the lock, or two threads can both pass the check
+    
+    LEARNING: __slots__
+    - Lists the attributes up front so objects skip the per-instance
+      __dict__, saving memory when a bank holds millions of accounts
     """
     
+    __slots__ = ('account_holder', 'account_number', '__balance', 'transaction_history', '_lock')
+    
     # Class variable (shared by all instances)
     bank_name = "Python Bank"
     total_accounts = 0
+    _counter_lock = threading.Lock()
+    ledger = None  # TransactionLedger that every account writes through
     
     def __init__(self, account_holder, account_number, initial_balance=0):
         """
@@ -37,10 +319,12 @@ class BankAccount:
         self.account_holder = account_holder
         self.account_number = account_number
         self.__balance = initial_balance  # Private attribute (name mangling)
-        self.transaction_history = []
+        self.transaction_history = TransactionLog()
+        self._lock = threading.Lock()
         
         # Increment class variable
-        BankAccount.total_accounts += 1
+        with BankAccount._counter_lock:
+            BankAccount.total_accounts += 1
         
         # Record account creation
         self._add_transaction("Account Created", initial_balance)
@@ -60,9 +344,11 @@ class BankAccount:
             print("❌ Deposit amount must be positive!")
             return False
         
-        self.__balance += amount
-        self._add_transaction("Deposit", amount)
-        print(f"✅ Deposited ${amount:.2f}. New balance: ${self.__balance:.2f}")
+        with self._lock:
+            self.__balance += amount
+            self._add_transaction("Deposit", amount)
+            new_balance = self.__balance
+        print(f"✅ Deposited ${amount:.2f}. New balance: ${new_balance:.2f}")
         return True
     
     def withdraw(self, amount):
@@ -79,13 +365,17 @@ class BankAccount:
             print("❌ Withdrawal amount must be positive!")
             return False
         
-        if amount > self.__balance:
-            print(f"❌ Insufficient funds! Current balance: ${self.__balance:.2f}")
+        with self._lock:
+            balance = self.__balance
+            if amount <= balance:
+                self.__balance -= amount
+                self._add_transaction("Withdrawal", -amount)
+        
+        if amount > balance:
+            print(f"❌ Insufficient funds! Current balance: ${balance:.2f}")
             return False
         
-        self.__balance -= amount
-        self._add_transaction("Withdrawal", -amount)
-        print(f"✅ Withdrew ${amount:.2f}. New balance: ${self.__balance:.2f}")
+        print(f"✅ Withdrew ${amount:.2f}. New balance: ${balance - amount:.2f}")
         return True
     
     def get_balance(self):
@@ -109,45 +399,148 @@ class BankAccount:
         LEARNING: Object Interaction
         - Methods can interact with other objects of the same class
         - Demonstrates encapsulation: uses public methods of other objects
+        
+        LEARNING: Deadlock-free Locking
+        - A transfer needs both accounts' locks at once
+        - If thread 1 locks A then waits for B while thread 2 locks B then
+          waits for A, both wait forever (a deadlock)
+        - Always locking in the same global order (by account number)
+          makes that cycle impossible
         """
         if amount <= 0:
             print("❌ Transfer amount must be positive!")
             return False
         
-        if amount > self.__balance:
-            print(f"❌ Insufficient funds for transfer! Current balance: ${self.__balance:.2f}")
+        if recipient_account is self:
+            print("❌ Cannot transfer to the same account!")
             return False
         
-        # Withdraw from this account
-        self.__balance -= amount
-        self._add_transaction(f"Transfer to {recipient_account.account_number}", -amount)
-        
-        # Deposit to recipient account
-        recipient_account.__balance += amount
-        recipient_account._add_transaction(f"Transfer from {self.account_number}", amount)
+        first, second = sorted((self, recipient_account),
+                               key=lambda account: (account.account_number, id(account)))
+        with first._lock, second._lock:
+            balance = self.__balance
+            if amount <= balance:
+                # Withdraw from this account
+                self.__balance -= amount
+                self._add_transaction("Transfer to", -amount, recipient_account.account_number)
+                
+                # Deposit to recipient account
+                recipient_account.__balance += amount
+                recipient_account._add_transaction("Transfer from", amount, self.account_number)
+        
+        if amount > balance:
+            print(f"❌ Insufficient funds for transfer! Current balance: ${balance:.2f}")
+            return False
         
         print(f"✅ Transferred ${amount:.2f} to {recipient_account.account_holder}")
-        print(f"   Your new balance: ${self.__balance:.2f}")
+        print(f"   Your new balance: ${balance - amount:.2f}")
         return True
     
-    def _add_transaction(self, transaction_type, amount):
+    def apply_batch(self, ops):
+        """
+        📦 Batch Processing
+        
+        Applies many ('deposit' | 'withdraw', amount) operations at once,
+        all-or-nothing. Returns a list of (index, op, reason) for every
+        rejected operation; the batch is applied only if that list is empty.
+        
+        LEARNING: Atomic Batches
+        - Validate everything first, then apply: either every operation
+          happens or none does, like a database transaction
+        - One lock, one timestamp and one summary line per batch instead
+          of per operation makes bulk posting much faster
+        """
+        transaction_types = []
+        amounts = []
+        balances = []
+        rejected = []
+        
+        with self._lock:
+            # Pass 1: simulate the batch on a running balance
+            balance = self.__balance
+            for index, op in enumerate(ops):
+                if not isinstance(op, (tuple, list)) or len(op) != 2:
+                    rejected.append((index, op, "expected a (kind, amount) pair"))
+                    continue
+                
+                kind, amount = op
+                if isinstance(amount, bool) or not isinstance(amount, (int, float)):
+                    rejected.append((index, op, "amount must be a number"))
+                    continue
+                try:
+                    finite = math.isfinite(amount)
+                except OverflowError:  # an int too big for a float
+                    finite = False
+                if not finite:
+                    rejected.append((index, op, "amount must be finite"))
+                    continue
+                if not amount > 0:
+                    rejected.append((index, op, "amount must be positive"))
+                    continue
+                
+                if kind == 'deposit':
+                    transaction_types.append("Deposit")
+                    balance += amount
+                    amounts.append(amount)
+                elif kind == 'withdraw':
+                    if amount > balance:
+                        rejected.append((index, op, "insufficient funds"))
+                        continue
+                    transaction_types.append("Withdrawal")
+                    balance -= amount
+                    amounts.append(-amount)
+                else:
+                    rejected.append((index, op, f"unknown operation {kind!r}"))
+                    continue
+                balances.append(balance)
+            
+            if rejected:
+                print(f"❌ Batch rejected: {len(rejected)} invalid operation(s), nothing applied")
+                return rejected
+            
+            # Pass 2: every operation is valid, so commit them all
+            timestamp_ns = time.time_ns()
+            self.__balance = balance
+            self.transaction_history.extend(transaction_types, amounts, balances, timestamp_ns)
+            
+            if BankAccount.ledger is not None:
+                BankAccount.ledger.append_many([
+                    {'account': self.account_number, 'type': transaction_type, 'amount': amount,
+                     'balance': running, 'timestamp_ns': timestamp_ns}
+                    for transaction_type, amount, running in zip(transaction_types, amounts, balances)
+                ])
+        
+        print(f"✅ Applied {len(amounts)} operations. New balance: ${balance:.2f}")
+        return rejected
+    
+    def _add_transaction(self, transaction_type, amount, counterparty=None):
         """
         📝 Private Helper Method
         
-        Adds transaction to history.
+        Adds transaction to history (counterparty: the other account of a transfer).
         
         LEARNING: Private Methods (Convention)
         - Methods starting with _ are "private" (convention, not enforced)
         - Used internally by the class, not meant for external use
         """
-        from datetime import datetime
-        transaction = {
-            'type': transaction_type,
-            'amount': amount,
-            'balance': self.__balance,
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        self.transaction_history.append(transaction)
+        timestamp_ns = time.time_ns()
+        self.transaction_history.append(transaction_type, amount, self.__balance,
+                                        timestamp_ns, counterparty)
+        
+        # Write through to the durable ledger
+        if BankAccount.ledger is not None:
+            record = {
+                'account': self.account_number,
+                'type': transaction_type,
+                'amount': amount,
+                'balance': self.__balance,
+                'timestamp_ns': timestamp_ns
+            }
+            if counterparty is not None:
+                record['counterparty'] = counterparty
+            if transaction_type == "Account Created":
+                record['holder'] = self.account_holder
+            BankAccount.ledger.append(record)
     
     def show_transaction_history(self):
         """
@@ -210,6 +603,21 @@ class BankAccount:
         """
         return cls.total_accounts
     
+    @classmethod
+    def restore_from_ledger(cls, path=LEDGER_PATH):
+        """
+        ♻️ Alternative Constructor
+        
+        Recreates every account recorded in a ledger file with its last
+        balance. Returns {account_number: BankAccount}.
+        """
+        ledger, cls.ledger = cls.ledger, None  # don't log the restore itself
+        try:
+            return {number: cls(state['holder'], number, state['balance'])
+                    for number, state in TransactionLedger.replay(path).items()}
+        finally:
+            cls.ledger = ledger
+    
     @staticmethod
     def is_valid_account_number(account_number):
         """
@@ -225,6 +633,156 @@ class BankAccount:
         return isinstance(account_number, str) and len(account_number) >= 5
 
 
+class Bank:
+    """
+    🏛️ Bank - Account Registry
+    
+    Keeps every account in a dictionary keyed by account number, with a
+    second index by holder name.
+    
+    LEARNING: Hash Indexes
+    - A dict lookup takes the same time with 3 accounts or 3 million: O(1)
+    - Searching a list means checking every account one by one: O(n)
+    - A secondary index (holder -> accounts) trades a little memory for
+      fast lookups by another field
+    """
+    
+    def __init__(self, name=BankAccount.bank_name):
+        self.name = name
+        self._accounts = {}   # account_number -> BankAccount
+        self._by_holder = {}  # account_holder -> list of BankAccounts
+        self._lock = threading.Lock()  # keeps both indexes in step
+    
+    def _index(self, account):
+        """
+        Add an account to both indexes (caller holds the lock).
+        """
+        self._accounts[account.account_number] = account
+        self._by_holder.setdefault(account.account_holder, []).append(account)
+    
+    def add_account(self, account):
+        """
+        Register an existing BankAccount. Returns False for duplicates.
+        """
+        with self._lock:
+            if account.account_number in self._accounts:
+                print(f"❌ Account {account.account_number} already exists!")
+                return False
+            self._index(account)
+        return True
+    
+    @staticmethod
+    def _balance_problem(balance):
+        """
+        Return why balance can't open an account, or None if it's fine.
+        """
+        if isinstance(balance, bool) or not isinstance(balance, (int, float)):
+            return "invalid balance"
+        try:
+            finite = math.isfinite(balance)
+        except OverflowError:  # an int too big for a float
+            finite = False
+        if not finite:
+            return "non-finite balance"
+        if balance < 0:
+            return "negative balance"
+        return None
+    
+    def open_account(self, account_holder, account_number, initial_balance=0):
+        """
+        Create and register a new account. Returns it, or None if invalid.
+        """
+        if not BankAccount.is_valid_account_number(account_number):
+            print(f"❌ Invalid account number: {account_number!r}")
+            return None
+        
+        problem = self._balance_problem(initial_balance)
+        if problem is not None:
+            print(f"❌ Cannot open account {account_number}: {problem}")
+            return None
+        
+        with self._lock:
+            if account_number in self._accounts:
+                print(f"❌ Account {account_number} already exists!")
+                return None
+            account = BankAccount(account_holder, account_number, initial_balance)
+            self._index(account)
+        return account
+    
+    def load_csv(self, path):
+        """
+        📂 Bulk-create accounts from a CSV file.
+        
+        Expects columns account_holder, account_number, initial_balance.
+        Bad rows are skipped and summarized instead of stopping the load.
+        Returns the number of accounts created.
+        """
+        created = 0
+        skipped = []
+        with open(path, newline='', encoding='utf-8') as f, self._lock:
+            for line_number, row in enumerate(csv.DictReader(f), start=2):
+                number = row.get('account_number')
+                try:
+                    balance = float(row.get('initial_balance') or 0)
+                except ValueError:
+                    skipped.append((line_number, "invalid balance"))
+                    continue
+                
+                problem = self._balance_problem(balance)
+                if not BankAccount.is_valid_account_number(number):
+                    skipped.append((line_number, "invalid account number"))
+                elif number in self._accounts:
+                    skipped.append((line_number, "duplicate account number"))
+                elif problem is not None:
+                    skipped.append((line_number, problem))
+                else:
+                    self._index(BankAccount(row.get('account_holder'), number, balance))
+                    created += 1
+        
+        print(f"✅ Loaded {created:,} accounts from {path}")
+        if skipped:
+            print(f"⚠️  Skipped {len(skipped):,} rows, e.g. line {skipped[0][0]}: {skipped[0][1]}")
+        return created
+    
+    def get_account(self, account_number):
+        """
+        Return the account with this number, or None.
+        """
+        return self._accounts.get(account_number)
+    
+    def find_by_holder(self, account_holder):
+        """
+        Return every account owned by account_holder.
+        """
+        return list(self._by_holder.get(account_holder, []))
+    
+    def transfer(self, from_number, to_number, amount):
+        """
+        🔄 Transfer between two accounts given their account numbers.
+        """
+        source = self._accounts.get(from_number)
+        target = self._accounts.get(to_number)
+        if source is None or target is None:
+            print(f"❌ Account {from_number if source is None else to_number} not found!")
+            return False
+        return source.transfer(target, amount)
+    
+    def total_balance(self):
+        """
+        Return the sum of all balances held by the bank.
+        """
+        return sum(account.get_balance() for account in self._accounts.values())
+    
+    def __len__(self):
+        return len(self._accounts)
+    
+    def __contains__(self, account_number):
+        return account_number in self._accounts
+    
+    def __iter__(self):
+        return iter(list(self._accounts.values()))
+
+
 def main():
     """Main function demonstrating OOP concepts"""
     
@@ -232,11 +790,23 @@ def main():
     print("🏦 BANK ACCOUNT SYSTEM - OOP BASICS")
     print("=" * 60)
     
+    # Restore accounts saved by earlier runs, then log everything from now on
+    restored = {}
+    if os.path.exists(LEDGER_PATH):
+        restored = BankAccount.restore_from_ledger(LEDGER_PATH)
+        print(f"\n📒 Restored {len(restored)} accounts from {LEDGER_PATH}")
+    BankAccount.ledger = TransactionLedger(LEDGER_PATH)
+    
+    # The bank keeps every account so they can be found by number
+    bank = Bank()
+    for account in restored.values():
+        bank.add_account(account)
+    
     # Creating Objects (Instances)
     print("\n📝 Creating Bank Accounts...")
-    account1 = BankAccount("Alice Johnson", "ACC001", 1000)
-    account2 = BankAccount("Bob Smith", "ACC002", 500)
-    account3 = BankAccount("Charlie Brown", "ACC003")
+    account1 = bank.get_account("ACC001") or bank.open_account("Alice Johnson", "ACC001", 1000)
+    account2 = bank.get_account("ACC002") or bank.open_account("Bob Smith", "ACC002", 500)
+    account3 = bank.get_account("ACC003") or bank.open_account("Charlie Brown", "ACC003")
     
     print(f"\n✅ Created {BankAccount.get_total_accounts()} accounts")
     print(f"   Bank Name: {BankAccount.bank_name}")
@@ -267,7 +837,7 @@ def main():
     print(f"\n{'='*60}")
     print("🔄 TRANSFER OPERATIONS")
     print(f"{'='*60}")
-    account1.transfer(account2, 200)
+    bank.transfer("ACC001", "ACC002", 200)
     
     # Check balances
     print(f"\n{'='*60}")
@@ -316,38 +886,37 @@ def main():
         
         elif choice == '3':
             print("\nAvailable accounts for transfer:")
-            accounts = [account1, account2, account3]
-            for i, acc in enumerate(accounts, 1):
-                if acc != current_account:
-                    print(f"{i}. {acc.account_holder} ({acc.account_number})")
+            for acc in bank:
+                if acc is not current_account:
+                    print(f"   {acc.account_number}: {acc.account_holder}")
             
-            try:
-                choice_idx = int(input("Select recipient account: ")) - 1
-                if 0 <= choice_idx < len(accounts) and accounts[choice_idx] != current_account:
+            recipient_number = input("Enter recipient account number: ").strip()
+            if recipient_number == current_account.account_number or recipient_number not in bank:
+                print("❌ Invalid account selection!")
+            else:
+                try:
                     amount = float(input("Enter transfer amount: $"))
-                    current_account.transfer(accounts[choice_idx], amount)
-                else:
-                    print("❌ Invalid account selection!")
-            except (ValueError, IndexError):
-                print("❌ Invalid input!")
+                    bank.transfer(current_account.account_number, recipient_number, amount)
+                except ValueError:
+                    print("❌ Invalid amount!")
         
         elif choice == '4':
             current_account.show_transaction_history()
         
         elif choice == '5':
             print("\nSwitch to account:")
-            print("1. Alice Johnson")
-            print("2. Bob Smith")
-            print("3. Charlie Brown")
-            acc_choice = input("Select account (1-3): ").strip()
-            if acc_choice == '1':
-                current_account = account1
-            elif acc_choice == '2':
-                current_account = account2
-            elif acc_choice == '3':
-                current_account = account3
+            for acc in bank:
+                print(f"   {acc.account_number}: {acc.account_holder}")
+            
+            # Accept either an account number or a holder's name
+            acc_choice = input("Enter account number or holder name: ").strip()
+            matches = [bank.get_account(acc_choice)] if acc_choice in bank else bank.find_by_holder(acc_choice)
+            if len(matches) == 1:
+                current_account = matches[0]
+            elif matches:
+                print("❌ That holder has several accounts - enter an account number!")
             else:
-                print("❌ Invalid choice!")
+                print("❌ Account not found!")
         
         elif choice == '6':
             print(f"\n📋 Account Information:")
@@ -360,6 +929,8 @@ def main():
         elif choice == '7':
             print("\n👋 Thank you for using Python Bank!")
             print(f"📊 Total Accounts: {BankAccount.get_total_accounts()}")
+            BankAccount.ledger.close()
+            print(f"📒 Transactions saved to {LEDGER_PATH}")
             break
         
         else:
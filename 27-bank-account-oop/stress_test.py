@@ -0,0 +1,113 @@
+"""
+Bank Account System - Concurrency Stress Test
+=============================================
+Hammer BankAccount.transfer from many threads at once and check that
+no money is created or destroyed.
+
+🎯 LEARNING OBJECTIVES:
+- Run work concurrently with threading
+- Check an invariant (total money is conserved) after a race-prone workload
+- Measure throughput for different thread counts
+
+Usage:
+    python stress_test.py                          # 1M transfers per thread count
+    python stress_test.py --transfers 100000 --threads 1 2 4 8 16
+    python stress_test.py --accounts 10 --seed 7   # fewer accounts = more contention
+"""
+
+import argparse
+import contextlib
+import os
+import random
+import threading
+import time
+
+from main import BankAccount
+
+def make_accounts(count, seed):
+    """
+    Create count accounts with random whole-dollar balances.
+    
+    LEARNING: Whole-dollar amounts keep float sums exact, so the
+    conservation check can use == instead of a tolerance.
+    """
+    rng = random.Random(seed)
+    return [BankAccount(f"Holder {i}", f"STRESS{i:06d}", rng.randrange(100, 10000))
+            for i in range(count)]
+
+def transfer_worker(accounts, transfers, seed, start_barrier):
+    """
+    Perform random transfers between random pairs of accounts.
+    """
+    rng = random.Random(seed)
+    last = len(accounts) - 1
+    start_barrier.wait()
+    for _ in range(transfers):
+        source = accounts[rng.randint(0, last)]
+        target = accounts[rng.randint(0, last)]
+        if source is not target:
+            source.transfer(target, rng.randint(1, 500))
+
+def run_stress(accounts, total_transfers, thread_count, seed):
+    """
+    Split total_transfers across thread_count threads and time them.
+    
+    Returns the elapsed wall-clock seconds.
+    """
+    per_thread = total_transfers // thread_count
+    barrier = threading.Barrier(thread_count + 1)
+    threads = [threading.Thread(target=transfer_worker,
+                                args=(accounts, per_thread, seed + i, barrier))
+               for i in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    
+    barrier.wait()  # release every worker at the same moment
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+def main_cli():
+    """
+    Parse command-line options, run each thread count and report.
+    """
+    parser = argparse.ArgumentParser(description="Stress-test concurrent BankAccount transfers")
+    parser.add_argument('--accounts', type=int, default=100, help="number of accounts")
+    parser.add_argument('--transfers', type=int, default=10**6, help="transfers per thread count")
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8], help="thread counts to try")
+    parser.add_argument('--seed', type=int, default=42, help="random seed")
+    args = parser.parse_args()
+    
+    print("\n" + "="*60)
+    print("🧵 CONCURRENT TRANSFER STRESS TEST")
+    print("="*60)
+    print(f"{'Threads':>8} {'Transfers':>12} {'Seconds':>10} {'Transfers/sec':>15}  Money")
+    print("-"*60)
+    
+    failed = False
+    for thread_count in args.threads:
+        # Fresh accounts per run so transaction histories don't pile up
+        accounts = make_accounts(args.accounts, args.seed)
+        total_before = sum(account.get_balance() for account in accounts)
+        
+        # transfer() prints every success; send that to the void
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            elapsed = run_stress(accounts, args.transfers, thread_count, args.seed)
+        
+        total_after = sum(account.get_balance() for account in accounts)
+        conserved = (total_after == total_before
+                     and all(account.get_balance() >= 0 for account in accounts))
+        failed = failed or not conserved
+        
+        done = args.transfers // thread_count * thread_count
+        print(f"{thread_count:>8} {done:>12,} {elapsed:>10.2f} {done / elapsed:>15,.0f}  "
+              f"{'✅ conserved' if conserved else f'❌ {total_before:,.2f} -> {total_after:,.2f}'}")
+    
+    print("="*60)
+    if failed:
+        raise SystemExit("❌ Money was created or destroyed - transfers are not thread-safe!")
+    print("✅ Total money was conserved in every run")
+
+if __name__ == "__main__":
+    main_cli()